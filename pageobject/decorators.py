@@ -23,6 +23,23 @@ def nextpage(name):
     Returns:
         The wrapper to change the page class.
     """
+    # the kind of `name` never changes, decide how to find the next page once instead of on every call
+    if isinstance(name, str):
+        # only one possible target page is defined, use it and ignore the returned token
+        def next_page_name(token):
+            return name
+    elif isinstance(name, dict):
+        # target pages are defined in a dict, use token as key
+        def next_page_name(token):
+            return name.get(token, name.get('__default__'))
+    elif callable(name):
+        # target pages are defined as callable, use toke as input to the callable and return value as target
+        next_page_name = name
+    else:
+        def next_page_name(token):
+            msg = f'Parameter type to nextpage() must be string/dict/fuction. Value: {name}, Type: {type(name)}'
+            raise RuntimeError(msg)
+
     def wrapper(action):
         # action is the function defined in page object to be called and decorated
         # at the moment when it is decorated, it is a unbound method
@@ -31,26 +48,13 @@ def nextpage(name):
         def change_page(instance, *args, **kargs):
             # token is returned from the function and it is used to select which page to change to
             token = action(instance, *args, **kargs)
+            page_name = next_page_name(token)
 
-            if type(name) is str:
-                # only one possible target page is defined, use it and ignore the returned token
-                page_name = name
-            elif type(name) is dict:
-                # target pages are defined in a dict, use token as key
-                default = name.get('__default__')
-                page_name = name.get(token, default)
-            elif callable(name):
-                # target pages are defined as callable, use toke as input to the callable and return value as target
-                page_name = name(token)
-            else:
-                msg = f'Parameter type to nextpage() must be string/dict/fuction. Value: {name}, Type: {type(name)}'
-                raise RuntimeError(msg)
-
-            if type(page_name) is not str:
+            if not isinstance(page_name, str):
                 raise RuntimeError(
                     'Next page class must be a string, got: {} of type {}'.format(page_name, type(page_name)))
 
-            if not (isinstance(instance, PageObject) or isinstance(instance, PageComponent)):
+            if not isinstance(instance, (PageObject, PageComponent)):
                 raise TypeError('Instance is not PageObject or PageComponent')
 
             # create a new page object using the target page object class and webdriver
@@ -58,7 +62,7 @@ def nextpage(name):
 
             # call the on_enter() hook when changed to a new page
             if hasattr(p, 'on_enter'):
-                p.logger.debug('Running entering hook of {}'.format(page_name))
+                p.logger.debug('Running entering hook of %s', page_name)
                 p.on_enter()
             return p
         return change_page
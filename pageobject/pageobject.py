@@ -6,15 +6,232 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, \
+    WebDriverException
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import cached_property, lru_cache, singledispatch
 from importlib import import_module
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+import atexit
 import logging
-import sys
-import traceback
+import os
+import re
 
 from .wait import WaitMixin
 
 
+# Logger of pages created without one. Nothing is output unless the application configures logging for "pageobject",
+# or the environment variable PAGEOBJECT_LOG names a file to write debug logs to.
+page_logger = logging.getLogger('pageobject')
+page_logger.addHandler(logging.NullHandler())
+
+
+def _log_to_file(fname):
+    """Write debug logs of `page_logger` to a file from a background thread, keeping file I/O off element access"""
+    queue = SimpleQueue()
+    listener = QueueListener(queue, logging.FileHandler(fname, 'w'))
+    listener.start()
+    atexit.register(listener.stop)
+    page_logger.addHandler(QueueHandler(queue))
+    page_logger.setLevel(logging.DEBUG)
+
+
+if os.environ.get('PAGEOBJECT_LOG'):
+    _log_to_file(os.environ['PAGEOBJECT_LOG'])
+
+# characters of `Keys` are in the private use area, values containing them must be typed
+_special_keys = re.compile('[\ue000-\uf8ff]')
+
+# CSS selectors of elements by id, which match one element on the page only
+_unique_css = re.compile(r'^(#[\w-]+|\[id="[^"]*"\])$')
+
+
+# relative XPaths selecting descendants by tag and an optional id, name or class attribute, e.g. .//td[@class="total"]
+_simple_xpath = re.compile(r'^\.//(\*|[A-Za-z][\w-]*)(?:\[@(id|name|class)=([\'"])([^\'"]*)\3\])?$')
+
+
+def _normalize_locator(by, loc):
+    """
+    Convert ID, NAME, CLASS_NAME and TAG_NAME locators to the CSS selectors Selenium sends for them anyway, so that
+    they can use the paths working only on CSS selectors, e.g. reading elements in the browser. Simple relative XPaths
+    matching `_simple_xpath` are converted to the equivalent CSS selectors as well. Absolute XPaths ("//...") are kept
+    since they search the whole document even in a component. Other locators and compound class names, which Selenium
+    refuses, are kept as they are.
+    """
+    if by == By.XPATH:
+        m = _simple_xpath.match(loc)
+        if m is None:
+            return by, loc
+        tag, attr, _, value = m.groups()
+        if not attr:
+            return By.CSS_SELECTOR, tag
+        return By.CSS_SELECTOR, '{}[{}="{}"]'.format('' if tag == '*' else tag, attr, value)
+    if by == By.ID:
+        return By.CSS_SELECTOR, '[id="{}"]'.format(loc)
+    if by == By.NAME:
+        return By.CSS_SELECTOR, '[name="{}"]'.format(loc)
+    if by == By.CLASS_NAME and not any(c.isspace() for c in loc.strip()):
+        return By.CSS_SELECTOR, '.{}'.format(loc)
+    if by == By.TAG_NAME:
+        return By.CSS_SELECTOR, loc
+    return by, loc
+
+
+@lru_cache(maxsize=256)
+def _format_cached(template, *parameters):
+    return template.format(*parameters)
+
+
+def _format_locator(template, *parameters):
+    """
+    Solidify a locator template. Results are cached since the same templates are solidified over and over, which is
+    faster than formatting the template again or joining its pre-parsed pieces in Python.
+    """
+    try:
+        return _format_cached(template, *parameters)
+    except TypeError:
+        # unhashable parameters cannot be cached
+        return template.format(*parameters)
+
+
+@lru_cache(maxsize=None)
+def _resolve_page_class(next_page):
+    """Import the page class by its absolute path. Classes are cached to skip importing on every page change"""
+    path, cls = next_page.rsplit('.', 1)
+    return getattr(import_module(path), cls)
+
+
+# Rules to read and write elements used by `PageElement._get_element()` and `PageElement._set_element()`. Tables are
+# built once here instead of on every call. Readers take (element, checked), writers take (instance, element, value,
+# checked) where `checked` is the selection state of the element read along with its tag.
+
+def _read_select(e, checked):
+    return Select(e).first_selected_option.text
+
+
+def _read_checked(e, checked):
+    return checked
+
+
+def _read_value(e, checked):
+    return e.get_attribute('value')
+
+
+def _read_text(e, checked):
+    return e.get_attribute('textContent').strip()
+
+
+def _write_select(instance, e, value, checked):
+    Select(e).select_by_visible_text(value)
+
+
+def _write_checkbox(instance, e, value, checked):
+    if checked is not value:
+        e.click()
+
+
+def _write_radio(instance, e, value, checked):
+    if value:
+        e.click()
+
+
+def _write_text(instance, e, value, checked):
+    instance.clear_text(e)
+    e.send_keys(str(value))
+
+
+# keyed by tag name, or "input:<type>" for <input>
+_read_actions = {
+    'select': _read_select,
+    'input:checkbox': _read_checked,
+    'input:radio': _read_checked,
+    'input:text': _read_value,
+    'input:number': _read_value,
+    'input:url': _read_value,
+    'textarea': _read_value,
+}
+
+# keyed by "select" for <select>, or the type of the element
+_write_actions = {
+    'select': _write_select,
+    'checkbox': _write_checkbox,
+    'radio': _write_radio,
+}
+
+
+# Rules to set an array of elements by the type of the value, used by `PageElements` and `PageElementsTemplate`.
+# Subclasses of the types, e.g. OrderedDict, are accepted as well.
+
+@singledispatch
+def _set_elements(value, descriptor, instance, elements):
+    raise ValueError('The value is not supported by PageElement "{}" setting: {}'.format(descriptor.name, str(value)))
+
+
+@_set_elements.register(list)
+@_set_elements.register(tuple)
+def _set_elements_pairwise(value, descriptor, instance, elements):
+    # an array of values are zipped to elements and stops whichever exhausts first
+    descriptor._assign_elements(instance, elements, value)
+
+
+@_set_elements.register(dict)
+def _set_elements_indexed(value, descriptor, instance, elements):
+    # set value (value of dict) by index (key of dict) to element, invalid indexes are logged and skipped
+    descriptor._assign_indexed(instance, elements, value)
+
+
+@_set_elements.register(int)
+@_set_elements.register(str)
+def _set_elements_all(value, descriptor, instance, elements):
+    # set an entire array of elements to a single value
+    descriptor._assign_elements(instance, elements, [value] * len(elements))
+
+
+# Conditions of `PageTable` queries built from the expected values. The same queries are run over and over, so the
+# conditions are built once for each expected value, logger and logging switch.
+
+def _condition(ref, logger, debug):
+    """
+    Build a condition checking an attribute of table rows. Conditions of functions and unhashable values are built
+    every time, so that the cache does not keep functions, and the pages they may refer to, alive.
+
+    Args:
+        ref: the expected value, or a function taking the attribute and returning a bool
+        logger (Logger): the logger of the page
+        debug (bool): whether to log the result
+    """
+    if callable(ref):
+        return _build_condition(ref, logger, debug)
+    try:
+        return _cached_condition(ref, logger, debug)
+    except TypeError:
+        return _build_condition(ref, logger, debug)
+
+
+def _build_condition(ref, logger, debug):
+    if callable(ref):
+        def cond(x):
+            result = ref(x)
+            if debug:
+                logger.debug('value[%s] matching <lambda function>? => %s', x, result)
+            return result
+    else:
+        # the text of the attribute is compared if it is a WebElement
+        def cond(x):
+            t = x.get_attribute('textContent').strip() if isinstance(x, WebElement) else x
+            matched = t == ref
+            if debug:
+                logger.debug('value[%s] == expected[%s]? => %s', t, ref, matched)
+            return matched
+    return cond
+
+
+# typed, so that equal values of different types such as 1 and True do not share a condition
+_cached_condition = lru_cache(maxsize=256, typed=True)(_build_condition)
+
+
 class PageElement(object):
     """
     The descriptor for a *single* DOM element in `PageObject` or `PageComponent`.
@@ -53,8 +270,65 @@ class PageElement(object):
 
     """
 
+    __slots__ = ('locator', '_by', '_locator', 'component', 'value_only', '_timeout', 'ignore_visibility', 'read_hook',
+                 'write_hook', 'cache', 'js_write', 'name')
+
+    # Javascript version of `_get_element()` to read values in the browser when elements are read in batch
+    _read_value_script = '''
+        function readValue(e) {
+            var tag = e.tagName.toLowerCase();
+            if (tag === 'select') {
+                return e.selectedOptions.length ? e.selectedOptions[0].text : null;
+            }
+            if (tag === 'textarea') {
+                return e.value;
+            }
+            if (tag === 'input') {
+                switch (e.type) {
+                    case 'checkbox':
+                    case 'radio':
+                        return e.checked;
+                    case 'text':
+                    case 'number':
+                    case 'url':
+                        return e.value;
+                }
+            }
+            return e.textContent.trim();
+        }
+    '''
+
+    _tag_and_type_script = '''
+        var e = arguments[0];
+        // like WebElement.get_attribute(), the "type" property is preferred, e.g. "text" for <input> without type
+        return [e.tagName.toLowerCase(), e.type || e.getAttribute('type'), !!e.checked];
+    '''
+
+    # set values of text fields with one script. Nothing is written and false is returned if any element is not an
+    # enabled text field, and the elements are set one by one instead
+    _write_values_script = '''
+        var elements = arguments[0], values = arguments[1];
+        var textTypes = ['text', 'number', 'url', 'email', 'password', 'search', 'tel'];
+        var writable = elements.every(function (e) {
+            var tag = e.tagName.toLowerCase();
+            return (tag === 'textarea' || tag === 'input' && textTypes.indexOf(e.type) !== -1) &&
+                !e.disabled && !e.readOnly;
+        });
+        if (!writable) {
+            return false;
+        }
+        elements.forEach(function (e, i) {
+            // use the native setter so that frameworks tracking the value property notice the change
+            var proto = e.tagName.toLowerCase() === 'textarea' ? HTMLTextAreaElement : HTMLInputElement;
+            Object.getOwnPropertyDescriptor(proto.prototype, 'value').set.call(e, values[i]);
+            e.dispatchEvent(new Event('input', {bubbles: true}));
+            e.dispatchEvent(new Event('change', {bubbles: true}));
+        });
+        return true;
+    '''
+
     def __init__(self, loc, by=None, component=None, value_only=False, ignore_visibility=False, timeout=0,
-                read_hook=None, write_hook=None):
+                read_hook=None, write_hook=None, cache=False, js_write=False):
         """
         Create a new DOM element descriptor
 
@@ -63,7 +337,8 @@ class PageElement(object):
 
             by (string, optional): type of the locator. Defaults to None.
                 Options to this field is the same as in selenium.webdriver.common.by.By. It will use default_by in
-                `pageconfig` of the current context.
+                `pageconfig` of the current context. ID, NAME, CLASS_NAME and TAG_NAME locators, and simple relative
+                XPaths like './/td[@class="total"]', are converted to the equivalent CSS selectors.
             component (Sub-class of `PageComponent`, optional): The component of the current DOM. Defaults to None.
                 If a DOM element is a wrapper of a functional component, the component can be defined by another class
                 inherited from `PageComponent`. Apart from locating the element, it's also cast as the component object.
@@ -82,6 +357,12 @@ class PageElement(object):
                 The function must take two arguments (driver, element) and returns a value
             write_hook (callable, optional): a function to handle what happens when writing to an element.
                 Defaults to None. The function must take three arguments (driver, element, value)
+            cache (bool, optional): remember the located element on the page/component. Defaults to False.
+                The cached element is reused when reading the descriptor again as long as the cache generation of the
+                page does not change, and located again if it is stale. See `PageObject.invalidate_cache()`.
+            js_write (bool, optional): set text fields with a script instead of typing the value. Defaults to False.
+                Several elements are set in one go, but no keyboard events are fired. Values containing special keys
+                and elements other than text fields are still set by the default rule.
         """
         self.locator = loc
         self.by = by
@@ -91,39 +372,53 @@ class PageElement(object):
         self.ignore_visibility = ignore_visibility
         self.read_hook = read_hook
         self.write_hook = write_hook
+        self.cache = cache
+        self.js_write = js_write
 
     def __get__(self, instance, owner):
-        """Reading entrance to the descriptor. Return None if the element does not exist"""
+        """
+        Reading entrance to the descriptor. Return None if the element does not exist or the browser fails to read it.
+        Errors raised by the component or read_hook are not hidden.
+        """
 
-        instance.logger.debug('Accessing web element "{}": {}'.format(self.name, self._locator))
+        instance.logger.debug('Accessing web element "%s": %s', self.name, self._locator)
         try:
-            element = self._find_element(instance, self._locator)
-            return self._convert_element(instance, element)
-        except Exception:
-            instance.logger.debug('Cannot find the element')
-            instance.logger.debug(traceback.format_exc())
+            return self._apply_cached(instance, lambda e: self._convert_element(instance, e), optional=True)
+        except WebDriverException:
+            instance.logger.debug('Cannot find the element', exc_info=True)
             return None
 
     def __set__(self, instance, value):
         """Write entrance to the descriptor. Raises NoSuchElement if element does not exist"""
 
-        instance.logger.debug('Setting web element: "{}": {} to  {}'.format(self.name, self._locator, value))
-        element = self._find_element(instance, self._locator)
-        self._assign_element(instance, element, value)
+        instance.logger.debug('Setting web element: "%s": %s to  %s', self.name, self._locator, value)
+        self._apply_cached(instance, lambda e: self._assign_element(instance, e, value))
 
     def __set_name__(self, owner, name):
         self.name = name
 
+    @property
+    def by(self):
+        return self._by
+
+    @by.setter
+    def by(self, by):
+        # locators derived from the type are refreshed whenever it changes, e.g. when `pageconfig` sets default_by
+        self._by = by
+        self._locator = _normalize_locator(by or By.ID, self.locator)
+        self._parse_locators()
+
+    def _parse_locators(self):
+        """Precompute locators depending on the locator type. It is called every time `by` is set."""
+        pass
+
     def timeout(self, instance):
         return self._timeout
 
-    @property
-    def _locator(self):
-        return self.by or By.ID, self.locator
-
     def _find(self, driver, instance, loc, func):
         """
-        Wait for element to be visible then return the element(s).
+        Wait for element to be visible then return the element(s). If `ignore_visibility` is set, the element is
+        located and returned after the wait times out even though it is not visible.
 
         Args:
             driver (WebDriver): The webdriver instance currently used.
@@ -140,33 +435,133 @@ class PageElement(object):
             WebElement: The located web element
         """
 
-        # call element access hook if it is defined
-        # don't access any PageElement in the hook, otherwise it will cause infinite recursive
-        if hasattr(instance.page, 'on_access_element'):
-            instance.page.on_access_element()
-        if hasattr(instance, 'on_access_element'):
-            instance.on_access_element()
+        self._on_access(instance)
 
-        if self.timeout(instance) != 0:
+        timeout = self.timeout(instance)
+        if timeout != 0:
+            # the element located by the last poll of the wait is returned, no need to locate it again
             try:
-                WebDriverWait(driver, self.timeout(instance)).until(EC.visibility_of_element_located(loc))
+                with instance.page._explicit_wait():
+                    return WebDriverWait(driver, timeout).until(lambda drv: self._located(func, loc))
             except TimeoutException as e:
                 if self.ignore_visibility:
                     instance.logger.debug(
-                        'Timeout when waiting element visible, ignore the error and try to operate on the element')
-                    instance.logger.debug(traceback.format_exc())
+                        'Timeout when waiting element visible, ignore the error and try to operate on the element',
+                        exc_info=True)
                 else:
                     raise e
         try:
             element = func(*loc)
         except NoSuchElementException as e:
-            instance.logger.debug('Cannot find the element {}: {} on page'.format(self.name, loc))
+            instance.logger.debug('Cannot find the element %s: %s on page', self.name, loc)
             raise e
         return element
 
+    def _located(self, func, loc):
+        """
+        Wait condition of `_find()`. Locate the element(s) in the context and check if the (first) element is visible.
+
+        Returns:
+            The located element(s), or False to keep waiting
+        """
+        try:
+            found = func(*loc)
+            first = found[0] if isinstance(found, list) else found
+            return found if first.is_displayed() else False
+        except (NoSuchElementException, StaleElementReferenceException, IndexError):
+            return False
+
+    def _on_access(self, instance):
+        """Call element access hooks of the page and the component if they are defined"""
+        # don't access any PageElement in the hook, otherwise it will cause infinite recursive
+        if hasattr(instance.page, 'on_access_element'):
+            instance.page.on_access_element()
+        if hasattr(instance, 'on_access_element'):
+            instance.on_access_element()
+
+    def _cache_key(self, instance, locator):
+        """
+        Key of the element in the cache of the page. Components are created on every access, so elements are cached by
+        the container element of the component rather than the component object.
+        """
+        container = None if instance is instance.page else instance.context.id
+        return container, self.name, locator
+
+    def _find_cached(self, instance, locator=None, optional=False):
+        """
+        Locate the element of the descriptor. If `cache` is set, the element located last time is reused when the
+        cache generation of the page is unchanged. Elements gone with navigation are stale and handled by the caller.
+
+        Args:
+            instance (PageObject or PageComponent): The context of the current descriptor
+            locator (tuple, optional): the locator of the element. Defaults to None, the locator of the descriptor.
+            optional (bool, optional): return None instead of raising NoSuchElementException if the element does not
+                exist. Defaults to False.
+
+        Returns:
+            WebElement: The located web element
+        """
+        locator = locator or self._locator
+        find = self._try_find_element if optional else self._find_element
+        if not self.cache:
+            return find(instance, locator)
+
+        page = instance.page
+        key = self._cache_key(instance, locator)
+        element = page.element_cache.get(key, page.cache_generation)
+        if element is None:
+            element = find(instance, locator)
+            if element is not None:
+                page.element_cache.put(key, page.cache_generation, element)
+        else:
+            # `_find()` calls the access hooks when locating the element, cached reads call them as well
+            self._on_access(instance)
+        return element
+
+    def _apply_cached(self, instance, func, locator=None, optional=False):
+        """
+        Apply a function to the element located by `_find_cached()`. If the element turns out to be stale, e.g. the
+        part of the page was refreshed after it was located, it is dropped from the cache, located again and the
+        function is retried once.
+
+        Args:
+            instance (PageObject or PageComponent): The context of the current descriptor
+            func (callable): the function taking the located element
+            locator (tuple, optional): the locator of the element. Defaults to None, the locator of the descriptor.
+            optional (bool, optional): return None without calling the function if the element does not exist,
+                instead of raising NoSuchElementException. Defaults to False.
+
+        Returns:
+            The return of the function
+        """
+        element = self._find_cached(instance, locator, optional)
+        try:
+            return None if element is None else func(element)
+        except StaleElementReferenceException:
+            # the element is gone, locate it again and retry once
+            instance.logger.debug('Element "%s" is stale, locating it again', self.name)
+            if self.cache:
+                instance.page.element_cache.pop(self._cache_key(instance, locator or self._locator))
+            element = self._find_cached(instance, locator, optional)
+            return None if element is None else func(element)
+
     def _find_element(self, instance, loc):
         return self._find(instance.page.context, instance, loc, instance.context.find_element)
 
+    def _try_find_element(self, instance, loc):
+        """
+        Locate an element with find_elements(), which returns nothing instead of raising an exception that has to be
+        built and caught when the element does not exist.
+
+        Returns:
+            WebElement: The located web element, None if it does not exist
+        """
+        elements = self._find(instance.page.context, instance, loc, instance.context.find_elements)
+        if not elements:
+            instance.logger.debug('Cannot find the element %s: %s on page', self.name, loc)
+            return None
+        return elements[0]
+
     def _find_elements(self, instance, loc):
         return self._find(instance.page.context, instance, loc, instance.context.find_elements)
 
@@ -191,13 +586,20 @@ class PageElement(object):
         if self.component:
             result = self.component(e, instance.page)
         elif self.value_only:
-            result = self._get_element(e)
+            result = self._get_element(e, instance.page)
         else:
-            result = Select(e) if e.tag_name == 'select' else e
+            result = Select(e) if self._element_tag(e, instance.page) == 'select' else e
         if self.read_hook:
             result = self.read_hook(instance, result)
         return result
 
+    def _element_tag(self, e, page):
+        """Tag name of the element, taken from `attr_cache_scope()` of the page if the element was read in it"""
+        cache = page._attr_cache
+        if cache is not None and e.id in cache:
+            return cache[e.id][0]
+        return e.tag_name
+
     def _assign_element(self, instance, e, value):
         """
         Set WebElement to a certain value.
@@ -218,7 +620,65 @@ class PageElement(object):
         else:
             self._set_element(instance, e, value)
 
-    def _get_element(self, element):
+    def _assign_elements(self, instance, elements, values):
+        """
+        Set WebElements to values pairwise, extra elements or values are ignored. If `js_write` is set, values are
+        written to text fields with one script (see `_write_values_script`), otherwise or if any of the elements is not
+        a text field, `_assign_element()` is applied to each of them.
+
+        Args:
+            instance (WebElement/WebDriver): Context of the current elements
+            elements (list): The WebElements to be set
+            values (list): The values to be set to the WebElements
+        """
+        pairs = list(zip(elements, values))
+        if pairs and self._writes_in_script(values):
+            elements, values = zip(*pairs)
+            if instance.page.context.execute_script(
+                    self._write_values_script, list(elements), [str(v) for v in values]):
+                return
+        for e, v in pairs:
+            self._assign_element(instance, e, v)
+
+    def _assign_indexed(self, instance, elements, values):
+        """
+        Set WebElements at the indexes given by the keys of a dict to the values, in the same way as
+        `_assign_elements()`. Keys which are not integers or out of range are logged and discarded.
+
+        Args:
+            instance (WebElement/WebDriver): Context of the current elements
+            elements (list): The WebElements located
+            values (dict): The values to be set keyed by index of the WebElements
+        """
+        selected = []
+        for k, v in values.items():
+            try:
+                selected.append((elements[int(k)], v))
+            except ValueError:
+                instance.logger.debug('Cannot change index to integer, value is disgarded, Key: %s, Value: %s', k, v)
+            except IndexError:
+                instance.logger.debug('Index out of range for PageElements %s, Key: %s, Value: %s', self.name, k, v)
+        if selected:
+            self._assign_elements(instance, *zip(*selected))
+
+    def _writes_in_script(self, values):
+        """
+        Check if the values can be written by `_write_values_script`. It requires `js_write` without write_hook, and
+        plain strings or numbers without special keys.
+        """
+        return self.js_write and not self.write_hook and all(
+            isinstance(v, (str, int, float)) and not isinstance(v, bool) and not _special_keys.search(str(v))
+            for v in values)
+
+    def _reads_in_script(self, instance):
+        """
+        Check if values of the descriptor can be read by `_read_value_script` in the browser instead of reading
+        elements one by one. It requires the default value reading rule without component, read_hook and waiting.
+        """
+        return self.value_only and not self.component and not self.read_hook and not self.timeout(instance) and \
+            type(self)._get_element is PageElement._get_element
+
+    def _get_element(self, element, page=None):
         """
         Default rule to get value from WebElement.
             - <select>: first selecte option text
@@ -228,29 +688,14 @@ class PageElement(object):
 
         Args:
             element (WebElement): The element to be read
+            page (PageObject, optional): The page of the element, to look up elements read in `attr_cache_scope()`
 
         Returns:
             The value of the element
         """
-        actions = {
-            'select': lambda e: Select(e).first_selected_option.text,
-            ('input', 'checkbox'): lambda e: e.is_selected(),
-            ('input', 'radio'): lambda e: e.is_selected(),
-            ('input', 'text'): lambda e: e.get_attribute('value'),
-            ('input', 'number'): lambda e: e.get_attribute('value'),
-            ('input', 'url'): lambda e: e.get_attribute('value'),
-            'textarea': lambda e: e.get_attribute('value'),
-            'default': lambda e: e.get_attribute('textContent').strip(),
-        }
-        tag = element.tag_name
-        input_type = element.get_attribute('type') if tag == 'input' else None
-        if tag in actions:
-            act = tag
-        elif input_type:
-            act = ('input', input_type)
-        else:
-            act = 'default'
-        return actions.get(act, actions['default'])(element)
+        tag, input_type, checked = self._tag_and_type(element, page)
+        act = 'input:{}'.format(input_type) if tag == 'input' else tag
+        return _read_actions.get(act, _read_text)(element, checked)
 
     def _set_element(self, instance, element, value):
         """
@@ -264,14 +709,34 @@ class PageElement(object):
             element (WebElement): The element to be set
             value: The value to be set to the element
         """
-        actions = dict(
-            select=lambda e, v: Select(e).select_by_visible_text(v),
-            checkbox=lambda e, v: e.click() if e.is_selected() is not v else None,
-            radio=lambda e, v: e.click() if v else None,
-            default=lambda e, v: (instance.clear_text(e), e.send_keys(str(value)))
-        )
-        act = 'select' if element.tag_name == 'select' else element.get_attribute('type')
-        actions.get(act, actions['default'])(element, value)
+        tag, input_type, checked = self._tag_and_type(element, instance.page)
+        act = 'select' if tag == 'select' else input_type
+        _write_actions.get(act, _write_text)(instance, element, value, checked)
+
+    def _tag_and_type(self, element, page=None):
+        """
+        Read what decides the rule to get or set an element with one script, instead of asking for the tag name, the
+        type and the selection state one by one.
+
+        Inside `attr_cache_scope()` of the page, the tag name and the type are read once for each element. Only the
+        checked state of checkboxes and radio buttons, which changes, is read again.
+
+        Args:
+            element (WebElement): The element to be read or set
+            page (PageObject, optional): The page of the element. Defaults to None, no cache is used.
+
+        Returns:
+            tuple: tag name in lower case, "type" attribute (None if not present) and checked state of the element
+        """
+        cache = page._attr_cache if page is not None else None
+        if cache is not None and element.id in cache:
+            tag, input_type = cache[element.id]
+            checked = element.is_selected() if tag == 'input' and input_type in ('checkbox', 'radio') else None
+            return tag, input_type, checked
+        tag, input_type, checked = element.parent.execute_script(self._tag_and_type_script, element)
+        if cache is not None:
+            cache[element.id] = tag, input_type
+        return tag, input_type, checked
 
 
 class PageElements(PageElement):
@@ -287,6 +752,29 @@ class PageElements(PageElement):
         - str/int: set *all* elements to the value passed in
     """
 
+    __slots__ = ()
+
+    # read values of all elements matching a CSS selector in the context element, or the document if it is null
+    _read_values_script = PageElement._read_value_script + '''
+        var root = arguments[0] || document;
+        return Array.prototype.map.call(root.querySelectorAll(arguments[1]), readValue);
+    '''
+
+    def _bulk_read_values(self, instance):
+        """
+        Read values of all elements with one script executed in the browser, instead of locating the elements and
+        reading them one by one. The locator must be a CSS selector.
+
+        Args:
+            instance (PageObject or PageComponent): The context of the current descriptor
+
+        Returns:
+            list: values of the elements
+        """
+        self._on_access(instance)
+        context = None if instance is instance.page else instance.context
+        return instance.page.context.execute_script(self._read_values_script, context, self._locator[1])
+
     def __get__(self, instance, owner):
         """
         Get an element array.
@@ -295,14 +783,15 @@ class PageElements(PageElement):
         If element cannot be found, it will return [].
         """
 
-        instance.logger.debug('Accessing web elements: "{}": {}'.format(self.name, self._locator))
+        instance.logger.debug('Accessing web elements: "%s": %s', self.name, self._locator)
         try:
+            if self._locator[0] == By.CSS_SELECTOR and self._reads_in_script(instance):
+                return self._bulk_read_values(instance)
             elements = self._find_elements(instance, self._locator)
             elements = [self._convert_element(instance, e) for e in elements]
             return elements
         except Exception:
-            instance.logger.debug('Cannot find the element')
-            instance.logger.debug(traceback.format_exc())
+            instance.logger.debug('Cannot find the element', exc_info=True)
             return []
 
     def __set__(self, instance, value):
@@ -317,28 +806,9 @@ class PageElements(PageElement):
             ValueError: if the value type is none of those listed aboved.
         """
 
-        instance.logger.debug('Setting web element: "{}": {} to  {}'.format(self.name, self._locator, value))
+        instance.logger.debug('Setting web element: "%s": %s to  %s', self.name, self._locator, value)
         elements = self._find_elements(instance, self._locator)
-
-        if type(value) in (list, tuple):
-            [self._assign_element(instance, e, v) for (e, v) in zip(elements, value)]
-        elif type(value) is dict:
-            for k, v in value.items():
-                try:
-                    index = int(k)
-                    self._assign_element(instance, elements[index], v)
-                except ValueError:
-                    instance.logger.debug(
-                        'Cannot change index to integer, value is disgarded, Key: {}, Value: {}'.format(k, v))
-                except IndexError:
-                    instance.logger.debug(
-                        'Index out of range for PageElements {}, Key: {}, Value: {}'.format(self.name, k, v))
-                    continue
-        elif type(value) in (int, str):
-            [self._assign_element(instance, e, value) for e in elements]
-        else:
-            raise ValueError(
-                'The value is not supported by PageElement "{}" setting: {}'.format(self.name, str(value)))
+        _set_elements(value, self, instance, elements)
 
 
 class PageElementTemplate(PageElement):
@@ -353,8 +823,13 @@ class PageElementTemplate(PageElement):
     This descriptor must be set to a tuple of two with the first one as paramters to the locator and the second one
     as value. Element will be located by the parameterized locator and then following the rule in `PageElement` to
     set value to the element.
+
+    If `cache` is set, elements located by the template are kept in the element cache of the page for each set of
+    parameters, so writing an element right after reading it with the same parameters does not locate it again.
     """
 
+    __slots__ = ()
+
     def _fetch_element(self, instance, owner, *parameters):
         """
         The actual function to locate and set an element. This function is wrapped and returned as the result of
@@ -367,14 +842,12 @@ class PageElementTemplate(PageElement):
         """
 
         instance.logger.debug(
-            'Accessing web element "{}": {} with parameter {}'.format(self.name, self._locator, parameters))
-        locator = self._locator[0], self._locator[1].format(*parameters)
+            'Accessing web element "%s": %s with parameter %s', self.name, self._locator, parameters)
+        locator = self._locator[0], _format_locator(self._locator[1], *parameters)
         try:
-            element = self._find_element(instance, locator)
-            return self._convert_element(instance, element)
+            return self._apply_cached(instance, lambda e: self._convert_element(instance, e), locator, optional=True)
         except Exception:
-            instance.logger.debug('Cannot find the element')
-            instance.logger.debug(traceback.format_exc())
+            instance.logger.debug('Cannot find the element', exc_info=True)
             return None
 
     def __set__(self, instance, value):
@@ -386,11 +859,10 @@ class PageElementTemplate(PageElement):
             value (tupe of two): Paramters to locator and value to be set. The first element is the locator and the
                 second is the value.
         """
-        loc_para = (value[0], ) if type(value[0]) is str else value[0]
-        locator = self._locator[0], self._locator[1].format(*loc_para)
-        instance.logger.debug('Setting web element: "{}": {} to  {}'.format(self.name, locator, value))
-        element = self._find_element(instance, locator)
-        self._assign_element(instance, element, value[1])
+        loc_para = (value[0], ) if isinstance(value[0], str) else value[0]
+        locator = self._locator[0], _format_locator(self._locator[1], *loc_para)
+        instance.logger.debug('Setting web element: "%s": %s to  %s', self.name, locator, value)
+        self._apply_cached(instance, lambda e: self._assign_element(instance, e, value[1]), locator)
 
     def __get__(self, instance, owner):
         """
@@ -412,6 +884,8 @@ class PageElementsTemplate(PageElement):
     and the second is the value to be set. It is the same as in `PageElements`
     """
 
+    __slots__ = ()
+
     def _fetch_element(self, instance, owner, *parameters):
         """
         The actual function to locate and set elements. This function is wrapped and returned as the result of
@@ -424,14 +898,13 @@ class PageElementsTemplate(PageElement):
         """
 
         instance.logger.debug(
-            'Accessing web element "{}": {} with parameter {}'.format(self.name, self._locator, parameters))
-        locator = self._locator[0], self._locator[1].format(*parameters)
+            'Accessing web element "%s": %s with parameter %s', self.name, self._locator, parameters)
+        locator = self._locator[0], _format_locator(self._locator[1], *parameters)
         try:
             elements = self._find_elements(instance, locator)
             return [self._convert_element(instance, e) for e in elements]
         except Exception:
-            instance.logger.debug('Cannot find the element')
-            instance.logger.debug(traceback.format_exc())
+            instance.logger.debug('Cannot find the element', exc_info=True)
             return []
 
     def __set__(self, instance, value):
@@ -444,39 +917,15 @@ class PageElementsTemplate(PageElement):
                 second is the value.
         """
         # build the locator
-        loc_para = (value[0], ) if type(value[0]) is str else value[0]
-        locator = self._locator[0], self._locator[1].format(*loc_para)
+        loc_para = (value[0], ) if isinstance(value[0], str) else value[0]
+        locator = self._locator[0], _format_locator(self._locator[1], *loc_para)
 
         # find all elements by the locator
-        instance.logger.debug('Setting web element: "{}": {} to  {}'.format(self.name, locator, value))
+        instance.logger.debug('Setting web element: "%s": %s to  %s', self.name, locator, value)
         elements = self._find_elements(instance, locator)
 
         # set values to elements
-        if type(value[1]) in (list, tuple):
-            # an array of values are zipped to elements and stops whichever exhausts first
-            [self._assign_element(instance, e, v) for (e, v) in zip(elements, value[1])]
-        elif type(value[1]) is dict:
-            # set value (value of dict) by index (key of dict) to element
-            for k, v in value[1].items():
-                try:
-                    index = int(k)
-                    self._assign_element(instance, elements[index], v)
-                except ValueError:
-                    # index is not an integer, log error and skip
-                    instance.logger.debug(
-                        'Cannot change index to integer, value is disgarded, Key: {}, Value: {}'.format(k, v))
-                    continue
-                except IndexError:
-                    # index out of range, log error and skip
-                    instance.logger.debug(
-                        'Index out of range for PageElements {}, Key: {}, Value: {}'.format(self.name, k, v))
-                    continue
-        elif type(value[1]) in (int, str):
-            # set an entire array of elements to a single value
-            [self._assign_element(instance, e, value[1]) for e in elements]
-        else:
-            # unknown type of value.
-            raise ValueError('The value is not supported by PageElement "{}" setting: {}'.format(self.name, str(value)))
+        _set_elements(value[1], self, instance, elements)
 
     def __get__(self, instance, owner):
         """
@@ -510,9 +959,72 @@ class PageElementDict(PageElement):
 
     """
 
+    __slots__ = ('_item_loc', '_key_loc', '_value_loc', '_item_by', '_key_by', '_value_by', 'key_hook',
+                 '_item_locator', '_key_locator', '_value_locator', '_items_locator')
+
+    # locators supported by the scripts below, see `_query_script`
+    _script_locators = (By.CSS_SELECTOR, By.XPATH)
+
+    # find elements by [type, locator] pairs of CSS selectors or XPaths relative to the root in the browser
+    _query_script = '''
+        function queryAll(root, loc) {
+            if (loc[0] !== 'xpath') {
+                return Array.prototype.slice.call(root.querySelectorAll(loc[1]));
+            }
+            var found = document.evaluate(loc[1], root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var elements = [];
+            for (var i = 0; i < found.snapshotLength; i++) {
+                elements.push(found.snapshotItem(i));
+            }
+            return elements;
+        }
+        function queryOne(root, loc) {
+            if (loc[0] !== 'xpath') {
+                return root.querySelector(loc[1]);
+            }
+            return document.evaluate(loc[1], root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+    '''
+
+    # read keys and values of all items in the container in one go, items without a key or a value are skipped
+    # if a list of keys is given as the last argument, only values of these keys are read
+    _read_dict_script = PageElement._read_value_script + _query_script + '''
+        var items = queryAll(arguments[0], arguments[1]);
+        var keys = arguments[4];
+        var result = [];
+        for (var i = 0; i < items.length; i++) {
+            var key = queryOne(items[i], arguments[2]);
+            key = key === null ? null : readValue(key);
+            if (keys !== null && keys.indexOf(key) === -1) {
+                continue;
+            }
+            var values = queryAll(items[i], arguments[3]).map(readValue);
+            if (key === null || values.length === 0 || values.indexOf(null) !== -1) {
+                continue;
+            }
+            result.push([key, values]);
+        }
+        return result;
+    '''
+
+    # locate the key element and value elements of all items in the container in one go
+    _locate_items_script = _query_script + '''
+        var keyLoc = arguments[2], valueLoc = arguments[3];
+        return queryAll(arguments[0], arguments[1]).map(function (item) {
+            return [queryOne(item, keyLoc), queryAll(item, valueLoc)];
+        });
+    '''
+
+    # read value elements located by `_locate_items_script`, one array of values for each item
+    _read_located_values_script = PageElement._read_value_script + '''
+        return arguments[0].map(function (elements) {
+            return elements.map(readValue);
+        });
+    '''
+
     def __init__(self, loc, item_loc, key_loc, value_loc, by=None, item_by=None, key_by=None, value_by=None,
                 component=None, value_only=False, ignore_visibility=False, timeout=0,
-                read_hook=None, write_hook=None, key_hook=None):
+                read_hook=None, write_hook=None, key_hook=None, js_write=False):
         """
         Initialize `PageElementDict` descriptor. It inherits `PageElement`.
 
@@ -548,36 +1060,184 @@ class PageElementDict(PageElement):
             write_hook (callable, optional): a function to handle what happens when writing to an element.
                 Defaults to None.
                 The function must take three arguments (driver, element, value)
+            js_write (bool, optional): set text field values of an item with one script. Defaults to False.
+                See `PageElement`.
         """
-        super().__init__(loc, by, component, value_only, ignore_visibility, timeout, read_hook, write_hook)
+        # item, key and value locators are needed by `_parse_locators()` which is called when `by` is set
         self._item_loc = item_loc
         self._key_loc = key_loc
         self._value_loc = value_loc
         self._item_by = item_by
         self._key_by = key_by
         self._value_by = value_by
+        super().__init__(loc, by, component, value_only, ignore_visibility, timeout, read_hook, write_hook,
+                         js_write=js_write)
         self.key_hook = key_hook
 
     def _loc(self, by, loc):
-        return by or self.by or By.ID, loc
+        return _normalize_locator(by or self.by or By.ID, loc)
+
+    def _parse_locators(self):
+        """Locators of items, keys and values default to the type of the container, build them once it is set"""
+        self._item_locator = self._loc(self._item_by, self._item_loc)
+        self._key_locator = self._loc(self._key_by, self._key_loc)
+        self._value_locator = self._loc(self._value_by, self._value_loc)
+        self._items_locator = self._combine_items_loc()
 
     @property
     def item_loc(self):
-        return self._loc(self._item_by, self._item_loc)
+        return self._item_locator
 
     @property
     def key_loc(self):
-        return self._loc(self._key_by, self._key_loc)
+        return self._key_locator
 
     @property
     def value_loc(self):
-        return self._loc(self._value_by, self._value_loc)
+        return self._value_locator
+
+    @property
+    def items_loc(self):
+        """
+        A single locator finding dictionary items directly in the context of the descriptor, which saves locating the
+        container first. It is only available when the container and the item locators are of the same type:
+
+            - CSS selector: the container must be located by id, e.g. "#menu", so that it matches one element only.
+              The two selectors are joined as descendant selectors
+            - XPath: the item locator must be relative (starting with "./") and is appended to the first container
+
+        Returns:
+            tuple: the combined locator, or None if the locators cannot be combined
+        """
+        return self._items_locator
+
+    def _combine_items_loc(self):
+        by, loc = self._locator
+        item_by, item_loc = self.item_loc
+        if by != item_by:
+            return None
+        if by == By.CSS_SELECTOR and _unique_css.match(loc) and ',' not in item_loc:
+            return by, '{} {}'.format(loc, item_loc)
+        if by == By.XPATH and item_loc.startswith('./'):
+            return by, '({})[1]{}'.format(loc, item_loc[1:])
+        return None
+
+    def _reads_in_script(self, instance):
+        """
+        The dictionary can be read in the browser if values can be, keys are read by the default rule and all of
+        item, key and value locators are CSS selectors or XPaths.
+        """
+        return super()._reads_in_script(instance) and not self.key_hook and self._script_locatable()
+
+    def _locates_in_script(self, instance):
+        """
+        Check if key and value elements of all items can be located by `_locate_items_script`. It requires item, key
+        and value locators to be CSS selectors or XPaths and no waiting for visibility.
+        """
+        return not self.timeout(instance) and self._script_locatable()
+
+    def _script_locatable(self):
+        """Check if item, key and value locators can be used by `_query_script`"""
+        return all(loc[0] in self._script_locators for loc in (self.item_loc, self.key_loc, self.value_loc))
+
+    def _reads_values_in_script(self, instance):
+        """
+        Check if values can be read by `_read_located_values_script`, which is still possible when keys cannot be read
+        in the browser, e.g. key_hook is set.
+        """
+        return PageElement._reads_in_script(self, instance)
+
+    def _read_located_values(self, instance, items):
+        """
+        Read values of items located by `_locate_items()` with one script, instead of reading value elements one by
+        one.
+
+        Args:
+            instance (WebDriver/WebElemet): the context of the current element
+            items (list): (key element, value elements) of each item
+
+        Returns:
+            list: (key element, value elements, values) of each item, or the items passed in if the script fails
+        """
+        try:
+            values = instance.page.context.execute_script(
+                self._read_located_values_script, [ves for _, ves in items])
+        except WebDriverException:
+            instance.logger.debug('Cannot read dict values, reading them one by one', exc_info=True)
+            return items
+        return [(ke, ves, vs) for (ke, ves), vs in zip(items, values)]
+
+    def _locate_items(self, instance):
+        """
+        Locate the key element and value elements of all items with one script, instead of locating keys and values
+        item by item.
+
+        Args:
+            instance (WebDriver/WebElemet): the context of the current element
+
+        Returns:
+            list: (key element, value elements) of each item. The key element is None if it cannot be located. An
+                empty list will be returned if the container cannot be located
+        """
+        try:
+            container = self._find_element(instance, self._locator)
+            return instance.page.context.execute_script(
+                self._locate_items_script, container, list(self.item_loc), list(self.key_loc), list(self.value_loc))
+        except Exception:
+            instance.logger.debug('Cannot find element container', exc_info=True)
+            return []
+
+    def _bulk_read_dict(self, instance, keys=None):
+        """
+        Read the whole dictionary, or the given keys of it, with one script executed in the browser.
+
+        Args:
+            instance (WebDriver/WebElemet): the context of the current element
+            keys (list, optional): keys to be read. Defaults to None which reads all items.
+
+        Returns:
+            dict: keys and values of items in the container. An empty dictionary will be returned if the container
+                cannot be located
+        """
+        try:
+            container = self._find_element(instance, self._locator)
+            items = instance.page.context.execute_script(
+                self._read_dict_script, container, list(self.item_loc), list(self.key_loc), list(self.value_loc),
+                keys)
+            return dict((key, values[0] if len(values) == 1 else values) for key, values in items)
+        except Exception:
+            instance.logger.debug('Cannot read dict container', exc_info=True)
+            return {}
+
+    def read_many(self, instance, keys):
+        """
+        Read values of the given keys only. If the dictionary can be read in the browser, other items are skipped
+        there without reading their values, otherwise the whole dictionary is read and filtered.
+
+        It is usually called through the page/component, e.g. `page.read_many('my_dict', ['key1', 'key2'])`.
+
+        Args:
+            instance (PageObject or PageComponent): the page/component the descriptor belongs to
+            keys (iterable): keys to be read
+
+        Returns:
+            dict: keys found in the dictionary and their values
+        """
+        keys = list(keys)
+        instance.logger.debug('Reading keys of "%s": %s', self.name, keys)
+        if self._reads_in_script(instance):
+            return self._bulk_read_dict(instance, keys)
+        result = self.__get__(instance, type(instance))
+        return dict((key, result[key]) for key in keys if key in result)
 
     def _get_items(self, instance):
         """
         Find all items in the dictionary and return them as an array. Item are not separated into key and values
         at this point.
 
+        If the container and item locators can be combined (see `items_loc`), items are found in one lookup,
+        otherwise the container is located first and items are found in it.
+
         Args:
             instance (WebDriver/WebElemet): the context of the current element
 
@@ -586,16 +1246,19 @@ class PageElementDict(PageElement):
                 if no element found
         """
         try:
-            instance.logger.debug('Fetching dict container: {}'.format(self._locator))
-            dict_container = self._find_element(instance, self._locator)
-            instance.logger.debug('Fetching dict items: {}'.format(self.item_loc))
-            items = self._find(instance.page.context, instance, self.item_loc, dict_container.find_elements)
-        except Exception:
-            instance.logger.debug('Cannot find element container/items')
-            instance.logger.debug(traceback.format_exc())
+            items_loc = self.items_loc
+            if items_loc:
+                instance.logger.debug('Fetching dict items: %s', items_loc)
+                items = self._find_elements(instance, items_loc)
+            else:
+                instance.logger.debug('Fetching dict container: %s', self._locator)
+                dict_container = self._find_element(instance, self._locator)
+                instance.logger.debug('Fetching dict items: %s', self.item_loc)
+                items = self._find(instance.page.context, instance, self.item_loc, dict_container.find_elements)
+        except WebDriverException:
+            instance.logger.debug('Cannot find element container/items', exc_info=True)
             items = []
-        finally:
-            return items
+        return items
 
     def _get_key(self, instance, item):
         """
@@ -611,13 +1274,23 @@ class PageElementDict(PageElement):
         """
         try:
             element = self._find(instance.page.context, instance, self.key_loc, item.find_element)
-            key = self.key_hook(instance, element) if self.key_hook else self._get_element(element)
-        except Exception:
-            instance.logger.debug('Cannot find element key')
-            instance.logger.debug(traceback.format_exc())
-            key = None
-        finally:
-            return key
+        except WebDriverException:
+            instance.logger.debug('Cannot find element key', exc_info=True)
+            return None
+        return self._read_key(instance, element)
+
+    def _read_key(self, instance, element):
+        """
+        Read the key from a key element already located, the same way as `_get_key()`.
+
+        Returns:
+            The key of the element, None if it cannot be read
+        """
+        try:
+            return self.key_hook(instance, element) if self.key_hook else self._get_element(element, instance.page)
+        except WebDriverException:
+            instance.logger.debug('Cannot read element key', exc_info=True)
+            return None
 
     def _get_value(self, instance, item):
         """
@@ -636,15 +1309,13 @@ class PageElementDict(PageElement):
             ves = self._find(instance.page.context, instance, self.value_loc, item.find_elements)
             value = [self._convert_element(instance, ve) for ve in ves]
             value = None if not value else (value[0] if len(value) == 1 else value)
-        except Exception:
-            instance.logger.debug('Cannot find the element value')
-            instance.logger.debug(traceback.format_exc())
+        except WebDriverException:
+            instance.logger.debug('Cannot find the element value', exc_info=True)
             ves = []
             value = None
-        finally:
-            return ves, value
+        return ves, value
 
-    def _set_value(self, instance, item, values):
+    def _set_value(self, instance, item, values, ves=None):
         """
         Set value to an item in the dictionary. The value can be a list/tuple or a single value. If an array is
         provided, it will be zipped to each matching value element and set. If a single value is provided, it will
@@ -654,11 +1325,13 @@ class PageElementDict(PageElement):
             instance (WebDriver/WebElemet): the context of the current element
             item (WebElement): the element represents the current item
             values: value(s) to be set to the element
+            ves (list, optional): value elements of the item already located. Defaults to None which locates them.
         """
-        instance.logger.debug('Setting item value: {}'.format(self.value_loc))
-        ves = self._find(instance.page.context, instance, self.value_loc, item.find_elements)
+        instance.logger.debug('Setting item value: %s', self.value_loc)
+        if ves is None:
+            ves = self._find(instance.page.context, instance, self.value_loc, item.find_elements)
         target = values if len(ves) > 1 else [values]
-        [self._assign_element(instance, atom, atom_value) for (atom, atom_value) in zip(ves, target)]
+        self._assign_elements(instance, ves, target)
 
     def __get__(self, instance, owner):
         """
@@ -667,26 +1340,83 @@ class PageElementDict(PageElement):
         An empty dictionary will be returned if dictionary container cannot be located or items in the container
         cannot be located.
         """
-        instance.logger.debug('Accessing web elements: "{}": {}'.format(self.name, self._locator))
+        if instance is None:
+            # accessed from the class, e.g. to call `read_many()`
+            return self
+        instance.logger.debug('Accessing web elements: "%s": %s', self.name, self._locator)
         instance.logger.debug(
-            'Trying to build dict with item: {}, key: {}, value: {}'
-            .format(self.item_loc, self.key_loc, self.value_loc))
+            'Trying to build dict with item: %s, key: %s, value: %s', self.item_loc, self.key_loc, self.value_loc)
+
+        if self._reads_in_script(instance):
+            # read all items in the browser at once instead of fetching keys and values item by item
+            result = self._bulk_read_dict(instance)
+            instance.logger.debug('Found %s items', len(result))
+            return result
 
         result = {}
-        items = self._get_items(instance)
-        instance.logger.debug('Found {} items'.format(len(items)))
-        for i in items:
-            key = self._get_key(instance, i)
-            if key is None:
-                continue
-            _, value = self._get_value(instance, i)
-            if value is None:
+        if self._locates_in_script(instance):
+            # keys and values are located with the items, only reading them is left
+            items = self._locate_items(instance)
+            if items and self._reads_values_in_script(instance):
+                # only keys are left to be read item by item
+                items = self._read_located_values(instance, items)
+            pairs = (self._read_located_item(instance, *i) for i in items)
+        else:
+            items = self._get_items(instance)
+            pairs = (self._read_item(instance, i) for i in items)
+        instance.logger.debug('Found %s items', len(items))
+        debug = instance.logger.isEnabledFor(logging.DEBUG)
+        for key, value in pairs:
+            if key is None or value is None:
                 continue
             result[key] = value
-            instance.logger.debug('{} => {}'.format(key, value))
+            if debug:
+                instance.logger.debug('%s => %s', key, value)
 
         return result
 
+    def _read_item(self, instance, item):
+        """
+        Read the key and the value of an item. The value is not read if the key cannot be found.
+
+        Args:
+            instance (WebDriver/WebElemet): the context of the current element
+            item (WebElement): the element represents the current item
+
+        Returns:
+            tuple: the key and the value of the item, either of them is None if it cannot be found
+        """
+        key = self._get_key(instance, item)
+        if key is None:
+            return None, None
+        return key, self._get_value(instance, item)[1]
+
+    def _read_located_item(self, instance, key_element, value_elements, values=None):
+        """
+        Read the key and the value of an item from elements located by `_locate_items()`, following the same rules as
+        `_get_key()` and `_get_value()`.
+
+        Args:
+            instance (WebDriver/WebElemet): the context of the current element
+            key_element (WebElement): the key element of the item, None if it is not located
+            value_elements (list): the value elements of the item
+            values (list, optional): values already read by `_read_located_values()`. Defaults to None which reads
+                the value elements.
+
+        Returns:
+            tuple: the key and the value of the item, either of them is None if it cannot be read
+        """
+        if key_element is None or not value_elements or (values is not None and None in values):
+            return None, None
+        try:
+            key = self.key_hook(instance, key_element) if self.key_hook else \
+                self._get_element(key_element, instance.page)
+            value = values if values is not None else [self._convert_element(instance, ve) for ve in value_elements]
+        except Exception:
+            instance.logger.debug('Cannot read the element key or value', exc_info=True)
+            return None, None
+        return key, value[0] if len(value) == 1 else value
+
     def __set__(self, instance, value):
         """
         Set dictionary of elments. Note that it is NOT using the `[]` syntax due to limitation of descriptor.
@@ -694,24 +1424,81 @@ class PageElementDict(PageElement):
         Values to be set must be a dictionary with keys matchting `PageElementDict` keys and values to be set.
         """
         clone_values = dict(value)
-        instance.logger.debug('Setting web elements: "{}": {} to  {}'.format(self.name, self._locator, value))
+        instance.logger.debug('Setting web elements: "%s": %s to  %s', self.name, self._locator, value)
         instance.logger.debug(
-            'Trying to set dict with item: {}, key: {}, value: {}'
-            .format(self.item_loc, self.key_loc, self.value_loc))
+            'Trying to set dict with item: %s, key: %s, value: %s', self.item_loc, self.key_loc, self.value_loc)
 
-        # find elements on the page
-        items = self._get_items(instance)
-        instance.logger.debug('Found {} items'.format(len(items)))
-        for i in items:
+        # find elements on the page, keys and value elements of all items are located at once if possible
+        if self._locates_in_script(instance):
+            items = [(None, ke, ves) for ke, ves in self._locate_items(instance) if ke is not None]
+        else:
+            items = [(i, None, None) for i in self._get_items(instance)]
+        instance.logger.debug('Found %s items', len(items))
+        for i, ke, ves in items:
             if not clone_values:
                 break
-            key = self._get_key(instance, i)
+            key = self._get_key(instance, i) if ke is None else self._read_key(instance, ke)
             if key is None or key not in clone_values:
                 continue
             else:
                 v = clone_values.pop(key)
-            self._set_value(instance, i, v)
-            instance.logger.debug('Key matching, set element {} to {}'.format(key, value[key]))
+            self._set_value(instance, i, v, ves)
+            instance.logger.debug('Key matching, set element %s to %s', key, value[key])
+
+
+class PageElementCache(object):
+    """
+    Elements located by descriptors defined with `cache=True` in a page and its components. The cache is bounded, the
+    least recently used element is dropped when it is full.
+
+    Elements are saved with the cache generation of the page when they are located and are only returned for the same
+    generation. Stale elements are not detected here, descriptors drop them with `pop()` when they fail to be used.
+    """
+
+    def __init__(self, max_size=1024):
+        """
+        Create an empty cache.
+
+        Args:
+            max_size (int, optional): the maximum number of elements kept. Defaults to 1024.
+        """
+        self.max_size = max_size
+        self._elements = OrderedDict()
+
+    def get(self, key, generation):
+        """
+        Get a cached element.
+
+        Args:
+            key (tuple): the key of the element
+            generation (int): the current cache generation of the page
+
+        Returns:
+            WebElement: the cached element, None if it is not cached or it is cached in another generation
+        """
+        cached = self._elements.get(key)
+        if cached is None or cached[0] != generation:
+            return None
+        self._elements.move_to_end(key)
+        return cached[1]
+
+    def put(self, key, generation, element):
+        """Save an element located in the given cache generation, dropping the least recently used if full"""
+        self._elements[key] = generation, element
+        self._elements.move_to_end(key)
+        while len(self._elements) > self.max_size:
+            self._elements.popitem(last=False)
+
+    def pop(self, key):
+        """Drop an element from the cache if it is there"""
+        self._elements.pop(key, None)
+
+    def clear(self):
+        """Drop all elements"""
+        self._elements.clear()
+
+    def __len__(self):
+        return len(self._elements)
 
 
 class PageBase(WaitMixin):
@@ -720,6 +1507,49 @@ class PageBase(WaitMixin):
     Waiting function groups are mixed in by inheriting WaitMixin.
     """
 
+    _clear_text_script = '''
+        var e = arguments[0];
+        var proto = e.tagName.toLowerCase() === 'textarea' ? HTMLTextAreaElement : HTMLInputElement;
+        Object.getOwnPropertyDescriptor(proto.prototype, 'value').set.call(e, '');
+        e.dispatchEvent(new Event('input', {bubbles: true}));
+        e.dispatchEvent(new Event('change', {bubbles: true}));
+    '''
+
+    # locate text fields by CSS selectors in the context and set them with `PageElement._write_values_script`
+    _fill_script = '''
+        var context = arguments[0] || document;
+        var elements = arguments[1].map(function (s) { return context.querySelector(s); });
+        if (elements.indexOf(null) !== -1) {
+            return false;
+        }
+        return (function () {%s})(elements, arguments[2]);
+    ''' % PageElement._write_values_script
+
+    # locate an element by a CSS selector in the context and click it, false is returned if it does not exist
+    _click_script = '''
+        var e = (arguments[0] || document).querySelector(arguments[1]);
+        if (e === null) {
+            return false;
+        }
+        e.click();
+        return true;
+    '''
+
+    # `PageElement` descriptors of the class and its bases by name, collected once when the class is created
+    _page_elements = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Collect the `PageElement` descriptors of a new page/component class, attributes of subclasses win"""
+        super().__init_subclass__(**kwargs)
+        elements = {}
+        for base in reversed(cls.__mro__):
+            for name, attr in base.__dict__.items():
+                if isinstance(attr, PageElement):
+                    elements[name] = attr
+                else:
+                    elements.pop(name, None)
+        cls._page_elements = elements
+
     def __init__(self, context, page):
         """
         Initialize a `PageBase`.
@@ -751,8 +1581,123 @@ class PageBase(WaitMixin):
             element = getattr(self.context, name)
         except AttributeError:
             raise AttributeError('Cannot find attribute {} in {}'.format(name, self.__class__.__name__))
+        # methods of the wrapped object never change, keep them so that later lookups skip the delegation. Other
+        # attributes like `current_url` and `window_handles` are read from the wrapped object every time
+        if getattr(element, '__self__', None) is self.context:
+            self.__dict__[name] = element
         return element
 
+    def fill(self, **values):
+        """
+        Set several text fields defined by `PageElement` with one script, instead of locating and typing into each of
+        them. Values are set through the native setter with "input" and "change" events, like `js_write`. No key
+        events are fired, so widgets reacting to key presses need the fields to be assigned instead.
+
+        Fields are located in the browser, so the script is only used when all of them are plain `PageElement`s with
+        CSS selectors, without component, write_hook or timeout, and all values are strings or numbers. Otherwise, or
+        if any field is missing or not an enabled text field, each value is assigned to its descriptor in turn.
+
+        Args:
+            values: values keyed by the names of the fields
+
+        Raises:
+            AttributeError: the page/component has no `PageElement` of a name
+
+        Example:
+            page.fill(user='admin', password='secret')
+        """
+        if not values:
+            return
+        fields = [self._page_elements.get(name) for name in values]
+        for name, d in zip(values, fields):
+            if d is None:
+                raise AttributeError('No PageElement {} in {}'.format(name, self.__class__.__name__))
+        if all(self._fillable(d, v) for d, v in zip(fields, values.values())):
+            for d in fields:
+                d._on_access(self)
+            context = None if self is self.page else self.context
+            if self.page.context.execute_script(
+                    self._fill_script, context, [d._locator[1] for d in fields], [str(v) for v in values.values()]):
+                return
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def click_fast(self, name):
+        """
+        Locate and click an element defined by `PageElement` with one script, instead of locating it and clicking it
+        with two requests. It is a DOM click: the element is not scrolled into view or checked to be visible and not
+        covered as the native click does. Elements which are not plain `PageElement`s with CSS selectors, without
+        component or timeout, are located as raw elements and clicked natively.
+
+        Args:
+            name (str): name of the element
+
+        Raises:
+            AttributeError: the page/component has no `PageElement` of the name
+            NoSuchElementException: the element does not exist
+        """
+        d = self._page_elements.get(name)
+        if d is None:
+            raise AttributeError('No PageElement {} in {}'.format(name, self.__class__.__name__))
+        if type(d) is not PageElement or d._locator[0] != By.CSS_SELECTOR or d.component or d.timeout(self):
+            # the raw element is clicked, reading the descriptor may return a value, a component or a hook result
+            d._apply_cached(self, lambda e: e.click())
+            return
+        d._on_access(self)
+        context = None if self is self.page else self.context
+        if not self.page.context.execute_script(self._click_script, context, d._locator[1]):
+            raise NoSuchElementException('Cannot find the element {}: {}'.format(name, d._locator))
+
+    def read_many(self, name, keys):
+        """
+        Read values of the given keys only from a dictionary defined by `PageElementDict`, see
+        `PageElementDict.read_many`.
+
+        Args:
+            name (str): name of the dictionary
+            keys (iterable): keys to be read
+
+        Raises:
+            AttributeError: the page/component has no `PageElementDict` of the name
+
+        Returns:
+            dict: keys found in the dictionary and their values
+
+        Example:
+            page.read_many('details', ['Name', 'Email'])
+        """
+        d = self._page_elements.get(name)
+        if not isinstance(d, PageElementDict):
+            raise AttributeError('Cannot find dictionary {} in {}'.format(name, self.__class__.__name__))
+        return d.read_many(self, keys)
+
+    def _fillable(self, descriptor, value):
+        """Check if `fill()` can set the field with its script"""
+        if type(descriptor) is not PageElement or descriptor._locator[0] != By.CSS_SELECTOR or \
+                descriptor.component or descriptor.write_hook or descriptor.timeout(self):
+            return False
+        return isinstance(value, (str, int, float)) and not isinstance(value, bool) and \
+            not _special_keys.search(str(value))
+
+    def _actions(self):
+        """Create the ActionChains of the page. A new one is created for each operation since it keeps its actions"""
+        return ActionChains(self.page)
+
+    @contextmanager
+    def actions(self):
+        """
+        Queue several actions on one ActionChains and perform them together when the `with` block exits, instead of
+        performing each of them with a separate request like the helpers below. Nothing is performed if the block
+        raises an exception.
+
+        Example:
+            with page.actions() as ac:
+                ac.click(page.first).click(page.second)
+        """
+        ac = self._actions()
+        yield ac
+        ac.perform()
+
     def hover(self, element, offset=None):
         """
         Wrapper of ActionChain to hover over an element.
@@ -762,7 +1707,7 @@ class PageBase(WaitMixin):
                 WebElement or PageComponent
         """
         element = element.context if isinstance(element, PageComponent) else element
-        ac = ActionChains(self.page)
+        ac = self._actions()
         if not offset:
             ac.move_to_element(element).perform()
         else:
@@ -775,7 +1720,7 @@ class PageBase(WaitMixin):
         Args:
             keys (str): characters to be typed
         """
-        ac = ActionChains(self.page)
+        ac = self._actions()
         ac.send_keys(keys).perform()
 
     def double_click(self, element):
@@ -787,7 +1732,7 @@ class PageBase(WaitMixin):
                 WebElement or PageComponent
         """
         element = element.context if isinstance(element, PageComponent) else element
-        ac = ActionChains(self.page)
+        ac = self._actions()
         ac.double_click(element).perform()
 
     def right_click(self, element):
@@ -799,7 +1744,7 @@ class PageBase(WaitMixin):
                 WebElement or PageComponent
         """
         element = element.context if isinstance(element, PageComponent) else element
-        ac = ActionChains(self.page)
+        ac = self._actions()
         ac.context_click(element).perform()
 
     def drag_drop(self, element, target):
@@ -812,7 +1757,7 @@ class PageBase(WaitMixin):
         """
         element = element.context if isinstance(element, PageComponent) else element
         target = target.context if isinstance(target, PageComponent) else target
-        ac = ActionChains(self.page)
+        ac = self._actions()
         ac.drag_and_drop(element, target).perform()
 
     def scroll_to(self, element):
@@ -823,7 +1768,7 @@ class PageBase(WaitMixin):
             element (webelement): The element to be scrolled into view
         """
         element = element.context if isinstance(element, PageComponent) else element
-        ac = ActionChains(self.page)
+        ac = self._actions()
         ac.move_to_element(element).perform()
 
     def clear_text(self, element):
@@ -844,12 +1789,24 @@ class PageBase(WaitMixin):
             element (WebDriver): the text input element to be cleared.
         """
         element = element.context if isinstance(element, PageComponent) else element
-        ac = ActionChains(self.page)
+        ac = self._actions()
         ac.click(element) \
             .key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL) \
             .send_keys(Keys.BACK_SPACE) \
             .perform()
 
+    def clear_text_fast(self, element):
+        """
+        Clear the text in text input with one script instead of the five steps of `clear_text()`. It empties the value
+        through the native setter and fires "input" and "change" events, which is noticed by React as well. No keyboard
+        events are fired.
+
+        Args:
+            element (WebDriver): the text input element to be cleared.
+        """
+        element = element.context if isinstance(element, PageComponent) else element
+        self.page.context.execute_script(self._clear_text_script, element)
+
 
 class PageComponent(PageBase):
     """
@@ -873,9 +1830,102 @@ class PageObject(PageBase):
     for details.
     """
 
+    # the maximum number of elements kept in `element_cache`
+    cache_max = 1024
+
+    # seconds of the implicit wait in effect as known by `implicit()`, explicit waits turn it off while they poll
+    _implicit_wait = 0
+
+    # open each URL passed in in a new window
+    _open_windows_script = 'arguments[0].forEach(function (url) { window.open(url, "_blank"); });'
+
+    # run the width and the height scripts of `resize()` together
+    _size_script = 'return [(function () {{ {} }})(), (function () {{ {} }})()];'
+
     def __init__(self, drv, logger=None):
         super(PageObject, self).__init__(drv, self)
-        self.logger = logging.getLogger().addHandler(logging.StreamHandler(sys.stdout)) if not logger else logger
+        self.logger = logger or page_logger
+        # bumped by `invalidate_cache()`, elements cached in an older generation are located again
+        self.cache_generation = 0
+        self.element_cache = PageElementCache(self.cache_max)
+        # tag names and types of elements read in `attr_cache_scope()`, None outside of the scope
+        self._attr_cache = None
+
+    def invalidate_cache(self):
+        """
+        Drop all elements cached by descriptors defined with `cache=True`.
+
+        It bumps the cache generation of the page so elements cached in components of the page are discarded as well.
+        Call it after an action replaces elements in the DOM while the old ones are still attached, e.g. hidden instead
+        of removed. Removed elements and elements of a previous URL are stale and located again automatically.
+        """
+        self.logger.debug('Invalidating element cache.')
+        self.cache_generation += 1
+        self.element_cache.clear()
+
+    @contextmanager
+    def attr_cache_scope(self):
+        """
+        Remember the tag name and the type of elements read or set in the `with` block, which decide how the element is
+        read or set, so that reading the same element again does not ask the browser for them. Nested scopes share the
+        outer one. Elements replaced in the block are different elements and are read again.
+
+        Example:
+            with page.attr_cache_scope():
+                summary = [page.name, page.total, page.name]
+        """
+        outer = self._attr_cache
+        if outer is None:
+            self._attr_cache = {}
+        try:
+            yield
+        finally:
+            self._attr_cache = outer
+
+    @contextmanager
+    def implicit(self, seconds):
+        """
+        Let the browser wait for elements to appear when locating them in the `with` block, instead of polling from
+        here. The implicit wait of the driver before the block is read when it starts and restored when it exits.
+
+        It applies to elements located through the driver of this page in the block, by descriptors without timeout
+        or raw Selenium calls. Explicit waits, i.e. `wait()`, the `wait_*_after()` helpers and descriptors with a
+        timeout, turn it off while they poll so that the two waits do not add up. Other pages sharing the driver are
+        affected as well but do not turn it off in their waits.
+
+        Args:
+            seconds (float): the implicit wait of the driver in the block
+
+        Example:
+            with page.implicit(5):
+                page.menu.click()
+                page.submenu.click()
+        """
+        try:
+            outer = self.context.timeouts.implicit_wait
+        except WebDriverException:
+            self.logger.debug('Cannot read the implicit wait of the driver', exc_info=True)
+            outer = self._implicit_wait
+        self.context.implicitly_wait(seconds)
+        self._implicit_wait = seconds
+        try:
+            yield
+        finally:
+            self.context.implicitly_wait(outer)
+            self._implicit_wait = outer
+
+    @contextmanager
+    def _explicit_wait(self):
+        """Turn the implicit wait set by `implicit()` off in the block, for explicit waits polling from here"""
+        implicit = self._implicit_wait
+        if implicit:
+            # a condition locating a missing element would block for the implicit wait in every poll
+            self.context.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            if implicit:
+                self.context.implicitly_wait(implicit)
 
     def alert(self, timeout=0):
         """
@@ -910,12 +1960,35 @@ class PageObject(PageBase):
             The new window to be switched to.
         """
         script = 'return document.readyState == "complete"'
-        self.logger.debug('Switching to window[{}].'.format(window))
-        if type(window) is int:
+        self.logger.debug('Switching to window[%s].', window)
+        if isinstance(window, int):
             window = self.context.window_handles[window]
         self.context.switch_to.window(window)
         self.wait(lambda driver: driver.execute_script(script), timeout or self.timeout)
 
+    def open_windows(self, urls, timeout=0):
+        """
+        Open several URLs in new windows with one script, e.g. to visit detail pages of many rows without navigating
+        back and forth. The current window is not changed.
+
+        Args:
+            urls (list): URLs to be opened
+            timeout (int, optional): timeout value to wait for all the windows to show. Defaults to 0.
+
+        Returns:
+            list: handles of the opened windows, in the order of `WebDriver.window_handles`
+        """
+        urls = list(urls)
+        before = set(self.context.window_handles)
+        self.logger.debug('Opening %s window(s).', len(urls))
+        self.context.execute_script(self._open_windows_script, urls)
+
+        def _opened(driver):
+            handles = [h for h in driver.window_handles if h not in before]
+            return handles if len(handles) >= len(urls) else False
+
+        return self.wait(_opened, timeout or self.timeout)
+
     def frame(self, frame):
         """
         Switch to specified frame. A simple wrapper to `WebDriver.switch_to.frame`.
@@ -923,7 +1996,7 @@ class PageObject(PageBase):
         Args:
             frame (str): frame name.
         """
-        self.logger.debug('Switching to Frame[{}]'.format(frame))
+        self.logger.debug('Switching to Frame[%s]', frame)
         self.context.switch_to.frame(frame)
 
     def goto(self, next_page, window=None, frame=None, timeout=0):
@@ -966,8 +2039,8 @@ class PageObject(PageBase):
 
         height_script = height if height else 'return document.body.parentNode.scrollHeight'
         width_script = width if width else 'return document.body.parentNode.scrollWidth'
-        height = self.execute_script(height_script)
-        width = self.execute_script(width_script)
+        # both scripts are run as functions of one script to get the size with one request
+        width, height = self.execute_script(self._size_script.format(width_script, height_script))
         self.set_window_size(width, height)
 
     def capture_screen(self, fname):
@@ -992,10 +2065,8 @@ class PageObject(PageBase):
         Returns:
             PageObject: new `PageObject` of the specified class
         """
-        self.logger.debug('Changing page to <{}>'.format(next_page))
-        path, cls = next_page.rsplit('.', 1)
-        m = import_module(path)
-        cls = getattr(m, cls)
+        self.logger.debug('Changing page to <%s>', next_page)
+        cls = _resolve_page_class(next_page)
         return cls(drv, self.logger)
 
     def scroll_to_end(self, monitor_url):
@@ -1007,25 +2078,26 @@ class PageObject(PageBase):
         """
         self.logger.debug('Scrolling to page end to load more content')
         body_height = 'return document.body.scrollHeight'
-        last_height = self.execute_script(body_height)
+        # scroll to the bottom and return the height scrolled to, which saves measuring the height before scrolling
+        scroll_to_bottom = 'var h = document.body.scrollHeight; window.scrollTo(0, h); return h;'
 
         while True:
             # Scroll down to the bottom.
             with self.wait_http_request_after(monitor_url, timeout=1, ignore_timeout=True):
-                self.execute_script(f"window.scrollTo(0, {last_height});")
-            # Calculate new scroll height and compare with last scroll height.
+                last_height = self.execute_script(scroll_to_bottom)
+            # Calculate new scroll height after loading and compare with the height scrolled to.
             new_height = self.execute_script(body_height)
             if new_height == last_height:
                 break
-            last_height = new_height
 
 
 class PageTable(PageComponent):
     """
     `PageTable` is a type of `PageComponent` that behaves as a table. It provides ability to search and allows `[]`
     syntax to access rows in the table.
-    Note: It will be slow when the table contains large amount of rows for all rows are fetched and saved in a list. A
-    future improvement is to provide a generator version of query.
+    Note: By default all rows are fetched and saved in a list, which is slow when the table contains large amount of
+    rows. Iterating the table, or passing `stream=True` to `query()` and `apply()`, fetches rows in batches of
+    `_stream_batch_size` instead so that stopping early does not transfer the rest of the rows.
 
     `PageTable` needs to be configured with a locator `_row_locator` in raw Selenium locator format to find rows
     It also needs a `PageComponent` which is a subclass of `PageComponent` to convert a row to a proper object.
@@ -1050,111 +2122,395 @@ class PageTable(PageComponent):
     _row_locator = ('', '')
     _column_locator = ('', '')
     _row_component = PageComponent
+    _row_cache = None
+    _caching_rows = False
+    _stream_batch_size = 50
+
+    # fetch a slice of the rows matching a CSS selector in the table element
+    _row_batch_script = '''
+        return Array.prototype.slice.call(arguments[0].querySelectorAll(arguments[1]), arguments[2], arguments[3]);
+    '''
+
+    # read a row field ([selector, value_only]) the same way as reading the `PageElement` of the row component
+    _read_field_script = PageElement._read_value_script + '''
+        function readField(row, field) {
+            var e = row.querySelector(field[0]);
+            if (e === null) {
+                return null;
+            }
+            if (field[1]) {
+                return readValue(e);
+            }
+            // a <select> is read as a Select object which never equals a plain value
+            return e.tagName.toLowerCase() === 'select' ? {} : e.textContent.trim();
+        }
+    '''
+
+    # scrape values of the given row fields of the rows passed in
+    _scrape_rows_script = _read_field_script + '''
+        var fields = arguments[1];
+        return arguments[0].map(function (row) {
+            return fields.map(function (field) {
+                return readField(row, field);
+            });
+        });
+    '''
+
+    # text of the cells of each row passed in
+    _cell_texts_script = '''
+        return arguments[0].map(function (row) {
+            return Array.prototype.map.call(row.querySelectorAll('td, th'), function (cell) {
+                return cell.textContent.trim();
+            });
+        });
+    '''
+
+    # find the first row in the table matching the expected field values, stop scanning rows once it is found
+    _first_row_script = _read_field_script + '''
+        var rows = arguments[0].querySelectorAll(arguments[1]);
+        var fields = arguments[2], expected = arguments[3];
+        for (var i = 0; i < rows.length; i++) {
+            var matched = true;
+            for (var j = 0; matched && j < fields.length; j++) {
+                matched = readField(rows[i], fields[j]) === expected[j];
+            }
+            if (matched) {
+                return rows[i];
+            }
+        }
+        return null;
+    '''
 
     def __getitem__(self, index):
-        """Get a row by index from the table"""
-        row = self._all_rows()[index]
-        return self._row_component(row, self.page) if self._row_component else row
+        """Get a row by index, or a list of rows by slice, from the table. Rows are located with one request"""
+        rows = self._all_rows()[index]
+        if isinstance(index, slice):
+            return [self._wrap_row(row) for row in rows]
+        return self._wrap_row(rows)
 
     def __len__(self):
         """Return the total row number"""
         return len(self._all_rows())
 
+    def __iter__(self):
+        """Iterate rows of the table. Rows are fetched in batches as the iteration goes on"""
+        wrap = self._wrap_row
+        for row in self._iter_rows():
+            yield wrap(row)
+
+    @cached_property
+    def _wrap_row(self):
+        """The function casting a row element to the row component, decided once per table instead of once per row"""
+        if not self._row_component:
+            return lambda row: row
+        component, page = self._row_component, self.page
+        return lambda row: component(row, page)
+
     def _all_rows(self):
-        """Fetch all rows in the table in a list"""
+        """Fetch all rows in the table in a list. Rows are fetched only once in a `_cached_rows()` block"""
+        if self._row_cache is not None:
+            return self._row_cache
         elements = self.context.find_elements(*self._row_locator)
+        if self._caching_rows:
+            self._row_cache = elements
         return elements
 
-    def _expand_conditions(self, conditions):
+    def _iter_rows(self):
         """
-        Normalize query conditions. Expand single value condition to lambda.
+        Generate rows in the table, fetching `_stream_batch_size` rows with one script at a time. Rows already fetched
+        in a `_cached_rows()` block are reused, and all rows are fetched at once if the row locator is not a CSS
+        selector.
+        """
+        if self._row_cache is not None or self._row_locator[0] != By.CSS_SELECTOR:
+            yield from self._all_rows()
+            return
+        size = self._stream_batch_size
+        start = 0
+        while True:
+            batch = self.page.context.execute_script(
+                self._row_batch_script, self.context, self._row_locator[1], start, start + size)
+            yield from batch
+            if len(batch) < size:
+                return
+            start += size
+
+    @contextmanager
+    def _cached_rows(self):
+        """
+        Context of a single table operation. All `_all_rows()` calls in the block share the rows fetched by the first
+        call. Nested blocks reuse the cache of the outermost one, which drops the cache when it exits.
+        """
+        if self._caching_rows:
+            yield
+            return
+        self._caching_rows = True
+        try:
+            yield
+        finally:
+            self._caching_rows = False
+            self._row_cache = None
+
+    def _row_field(self, attr):
+        """
+        Find the row attribute that can be scraped in the browser. It must be a plain `PageElement` without component,
+        read_hook and timeout, located by a CSS selector. Nothing is scraped if the row component defines
+        `on_access_element()`, which must be called for each row.
+
+        Args:
+            attr (str): name of the attribute in the row component
+
+        Returns:
+            tuple: (selector, value_only) of the attribute, or None if it cannot be scraped
+        """
+        if hasattr(self._row_component, 'on_access_element'):
+            return None
+        e = self._row_component._page_elements.get(attr)
+        if type(e) is not PageElement or e.component or e.read_hook or e._timeout or \
+                e._locator[0] != By.CSS_SELECTOR:
+            return None
+        return e._locator[1], e.value_only
+
+    def _on_scrape(self):
+        """
+        Call the element access hook of the page once before row fields are read by a script, as reading them through
+        the row component would. Row components defining the hook are not scraped (see `_row_field()`).
+        """
+        if hasattr(self.page, 'on_access_element'):
+            self.page.on_access_element()
+
+    def _split_conditions(self, conditions):
+        """
+        Separate plain value conditions which can be evaluated in the browser from the others.
 
         Args:
             conditions (dict): conditions used for querying the table
 
         Returns:
-            dict: normalized conditions. All conditions are callables with one parameter and returns bool
-        """
-        expanded = {}
-        for k, v in conditions.items():
-            if not callable(v):
-                def cond(x, ref=v):
-                    t = x.get_attribute('textContent').strip() if isinstance(x, WebElement) else x
-                    self.page.logger.debug('value[{}] == expected[{}]? => {}'.format(t, ref, t == ref))
-                    return t == ref
+            tuple: row fields and expected values of conditions evaluated in the browser, and a dict of the
+                conditions left to be checked on row components
+        """
+        fields, expected, remaining = [], [], {}
+        for attr, ref in conditions.items():
+            field = None if callable(ref) or not self._row_component else self._row_field(attr)
+            if field:
+                fields.append(field)
+                expected.append(ref)
             else:
-                def cond(x, c=v):
-                    result = c(x)
-                    self.page.logger.debug('value[{}] matching <lambda function>? => {}'.format(x, result))
-                    return result
-            expanded[k] = cond
-            # expanded[k] = lambda x, ref=v: \
-            #     (x.get_attribute('textContent') if isinstance(x, WebElement) else x).strip() == ref
-        return expanded
+                remaining[attr] = ref
+        return fields, expected, remaining
 
-    def query(self, once=False, **conditions):
+    def _scrape_rows(self, fields, expected):
         """
-        Query the table by specified conditions.
+        Filter rows by plain value conditions with one script executed in the browser, instead of reading each
+        attribute of each row through the row component.
 
         Args:
-            once (bool, optional): If True, terminate at the first match and return the row. Defaults to False.
+            fields (list): (selector, value_only) of row fields to be compared
+            expected (list): expected values of the fields
 
         Returns:
-            If `once` is False, it will retrun all rows matching specified conditions in a list. `[]` will be returned
-            if no rows are found. If `once` is set to True, the row object matching conditions is returned, return None
-            if no row matches the condition.
+            list: rows matching the expected values
         """
-        self.page.logger.debug('Querying table with conditions: {}...'.format(str(conditions)))
+        # rows located by Selenium are passed to the script as one array, so any row locator works
         rows = self._all_rows()
-        result = []
+        self.page.logger.debug('Scraping %s rows by fields: %s', len(rows), fields)
+        self._on_scrape()
+        scraped = self.page.context.execute_script(self._scrape_rows_script, rows, fields)
+        return [row for row, values in zip(rows, scraped) if values == expected]
+
+    def _first_scraped_row(self, fields, expected):
+        """
+        Find the first row matching plain value conditions in the browser. Only the matching row is sent back, rows
+        after it are not even read. The row locator must be a CSS selector.
+
+        Args:
+            fields (list): (selector, value_only) of row fields to be compared
+            expected (list): expected values of the fields, compared by strict equality in Javascript
+
+        Returns:
+            WebElement: the first matching row, None if no row matches
+        """
+        self.page.logger.debug('Looking for the first row by fields: %s', fields)
+        self._on_scrape()
+        return self.page.context.execute_script(
+            self._first_row_script, self.context, self._row_locator[1], fields, expected)
+
+    def _expand_conditions(self, conditions):
+        """
+        Normalize query conditions. Expand single value condition to lambda.
+
+        Args:
+            conditions (dict): conditions used for querying the table
+
+        Returns:
+            list: normalized conditions as (attribute, condition) pairs. All conditions are callables with one
+                parameter and returns bool
+        """
+        # decide once whether matching is logged instead of formatting log messages for every row
+        logger = self.page.logger
+        debug = logger.isEnabledFor(logging.DEBUG)
+        return [(k, _condition(v, logger, debug)) for k, v in conditions.items()]
+
+    def _matching_rows(self, conditions, once, stream):
+        """
+        Generate row components matching the conditions, shared by `query()` and `apply()`.
+
+        Plain value conditions on row attributes defined by simple CSS located `PageElement` are evaluated in the
+        browser with one script (see `_scrape_rows()`). Only rows passing them are cast to the row component and
+        checked against the remaining conditions. If all conditions are evaluated in the browser and `once` is set, the
+        browser stops at the first matching row (see `_first_scraped_row()`).
+
+        Args:
+            conditions (dict): conditions used for querying the table
+            once (bool): only the first matching row is wanted
+            stream (bool): fetch rows in batches (see `_iter_rows()`) when no condition is evaluated in the browser
+        """
+        fields, expected, conditions = self._split_conditions(conditions)
+        if once and fields and not conditions and self._row_locator[0] == By.CSS_SELECTOR and \
+                all(ref is None or isinstance(ref, (str, bool)) for ref in expected):
+            # the whole query can be done in the browser, which stops at the first matching row
+            row = self._first_scraped_row(fields, expected)
+            if row:
+                yield self._wrap_row(row)
+            return
+
+        if fields:
+            rows = self._scrape_rows(fields, expected)
+        else:
+            rows = self._iter_rows() if once or stream else self._all_rows()
+
+        wrap = self._wrap_row
+        if not conditions:
+            # every row matches, skip checking rows one by one
+            yield from map(wrap, rows)
+            return
 
         conditions = self._expand_conditions(conditions)
 
         for i, row in enumerate(rows):
-            self.page.logger.debug('Checking row {}...'.format(i))
+            self.page.logger.debug('Checking row %s...', i)
+
+            row = wrap(row)
 
-            if self._row_component:
-                row = self._row_component(row, self.page)
+            for attr, cond in conditions:
+                if not cond(getattr(row, attr)):
+                    break
+            else:
+                self.page.logger.debug('Found matching row: %s', i)
+                yield row
 
-            if not conditions or all(cond(getattr(row, attr)) for (attr, cond) in conditions.items()):
-                self.page.logger.debug('Found matching row: {}'.format(i))
+    def query(self, once=False, stream=False, **conditions):
+        """
+        Query the table by specified conditions. See `_matching_rows()` for conditions evaluated in the browser.
+
+        Args:
+            once (bool, optional): If True, terminate at the first match and return the row. Defaults to False.
+            stream (bool, optional): If True, fetch rows in batches (see `_iter_rows()`). It is implied by `once`.
+                Defaults to False.
+
+        Returns:
+            If `once` is False, it will retrun all rows matching specified conditions in a list. `[]` will be returned
+            if no rows are found. If `once` is set to True, the row object matching conditions is returned, return None
+            if no row matches the condition.
+        """
+        self.page.logger.debug('Querying table with conditions: %s...', conditions)
+        with self._cached_rows():
+            result = []
+            for row in self._matching_rows(conditions, once, stream):
+                if once:
+                    self.page.logger.debug('Terminating immediately after found.')
+                    return row
                 result.append(row)
 
-            if result and once:
-                self.page.logger.debug('Terminating immediately after found.')
-                return result[0]
+            self.page.logger.debug('Found %s row(s)', len(result))
+            return None if once else result
+
+    def iter_query(self, **conditions):
+        """
+        Generate rows matching the conditions lazily, the same way as `query(stream=True)`. Without plain value
+        conditions, rows are fetched in batches and checked as the iteration goes on, so stopping early, e.g. with
+        `itertools.islice()`, does not fetch or check the rest of the rows. Plain value conditions are evaluated in the
+        browser for all rows at once when the iteration starts, only the remaining conditions are checked lazily.
+
+        No rows are cached between steps of the iteration. Rows already generated become stale if the page changes
+        while iterating, as any located element does.
 
-        self.page.logger.debug('Found {} row(s)'.format(len(result)))
-        return None if once and not result else result
+        Returns:
+            generator: row objects matching the conditions
+        """
+        self.page.logger.debug('Iterating table with conditions: %s...', conditions)
+        yield from self._matching_rows(conditions, False, True)
 
-    def apply(self, action, once=False, **conditions):
+    def apply(self, action, once=False, stream=False, **conditions):
         """
-        Similar to query, this method apply an action to matching rows in the table.
+        Similar to query, this method apply an action to matching rows in the table. Plain value conditions are
+        evaluated in the browser before any action is applied, the same way as in `query()`.
 
         Args:
             action (callable): the action to be applied to the row. It takes a single parameter representing the row
                 object
             once (bool, optional): If True, terminate at the first match. Defaults to False.
+            stream (bool, optional): If True, fetch rows in batches (see `_iter_rows()`). It is implied by `once`.
+                Do not use it with actions adding or removing rows, which shifts the rows of later batches.
+                Defaults to False.
         """
-        self.page.logger.debug('Applying operation to table with conditions: {}...'.format(str(conditions)))
-        rows = self._all_rows()
-        result = []
+        self.page.logger.debug('Applying operation to table with conditions: %s...', conditions)
+        with self._cached_rows():
+            for row in self._matching_rows(conditions, once, stream):
+                action(row)
 
-        conditions = self._expand_conditions(conditions)
+                if once:
+                    self.page.logger.debug('Terminating immediately after found.')
+                    break
 
-        for i, row in enumerate(rows):
-            self.page.logger.debug('Checking row {}...'.format(i))
+    def snapshot(self, *columns):
+        """
+        Read the given attributes of all rows into dicts. Attributes that are plain `PageElement`s located by CSS
+        selectors in the row component are read for all rows with one script: the value of value-only elements and the
+        text of the others. Any other attribute is read through the row object.
 
-            if self._row_component:
-                row = self._row_component(row, self.page)
+        Tables without a row component, or whose row component defines no `PageElement`, have no attributes to read.
+        The text of the cells (<td> and <th>) of each row is read instead.
 
-            if not conditions or all(cond(getattr(row, attr)) for (attr, cond) in conditions.items()):
-                self.page.logger.debug('Found matching row: {}'.format(i))
-                action(row)
+        Values read by the script do not go through the element access hooks one by one: `on_access_element()` of the
+        page is called once before the script. If the row component defines `on_access_element()`, every attribute is
+        read through the row objects, which calls the hooks as usual.
 
-            if result and once:
-                self.page.logger.debug('Terminating immediately after found.')
-                break
+        Args:
+            columns (str): names of the attributes of the row component. Defaults to all `PageElement`s defined in it.
+
+        Raises:
+            ValueError: columns are given but the row component defines no `PageElement`
+
+        Returns:
+            list: a dict of the attribute values for each row, or a list of the cell texts if there is no row component
+        """
+        elements = self._row_component._page_elements if self._row_component else {}
+        if not elements:
+            if columns:
+                raise ValueError('Row component of the table defines no columns: {}'.format(columns))
+            rows = self._all_rows()
+            self.page.logger.debug('Reading cells of %s rows', len(rows))
+            self._on_scrape()
+            return self.page.context.execute_script(self._cell_texts_script, rows)
+        columns = columns or list(elements)
+        fields = {c: self._row_field(c) for c in columns}
+        scraped_columns = [c for c in columns if fields[c]]
+        rows = self._all_rows()
+        self.page.logger.debug('Reading %s rows of columns: %s', len(rows), columns)
+        scraped = [[] for _ in rows]
+        if scraped_columns:
+            self._on_scrape()
+            scraped = self.page.context.execute_script(
+                self._scrape_rows_script, rows, [fields[c] for c in scraped_columns])
+        result = []
+        for row, values in zip(rows, scraped):
+            item = dict(zip(scraped_columns, values))
+            if len(item) < len(columns):
+                wrapped = self._wrap_row(row)
+                item.update((c, getattr(wrapped, c)) for c in columns if not fields[c])
+            result.append({c: item[c] for c in columns})
+        return result
 
     def column(self, column_ident, component=None):
         """
@@ -1169,8 +2525,9 @@ class PageTable(PageComponent):
         Returns:
             list: a list of `PageElement` or `PageComponent` found by the column
         """
-        if type(column_ident) not in (tuple, list):
+        if not isinstance(column_ident, (tuple, list)):
             column_ident = (column_ident,)
-        locator = self._column_locator[0], self._column_locator[1].format(*column_ident)
+        by, template = self._column_locator
+        locator = by, _format_locator(template, *column_ident)
         cells = self.context.find_elements(*locator)
         return [component(c, self.page) for c in cells] if component is not None else cells
@@ -1,9 +1,9 @@
 import logging
-import inspect
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
-import traceback
+from selenium.webdriver.support.wait import POLL_FREQUENCY
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, \
+    WebDriverException
 import re
 
 
@@ -28,18 +28,27 @@ The pattern to use this is to set a safe timeout value on the most general level
 specificly when needed and share the general settings for the majority of pages/components.
 """
 
+# polling intervals in seconds of the wait objects. The conditions of most of them are cheap scripts which can be
+# polled more often than the default of WebDriverWait, the resource timing entries of HTTP requests are heavier.
+FAST_POLL = 0.1
+SLOW_POLL = 0.25
+
 
 class BaseWaitAfter(object):
     """
     Abstract class for waiting after an action. It is used in a `with` block.
     """
 
-    def __init__(self, context, timeout=0, ignore_timeout=False):
-        """Initialize a Wait object"""
+    poll_frequency = FAST_POLL
+
+    def __init__(self, context, timeout=0, ignore_timeout=False, poll_frequency=None):
+        """Initialize a Wait object. The class default of `poll_frequency` is used if it is not given."""
         self.context = context
         self.logger = context.logger
         self._timeout = timeout
         self.ignore_timeout = ignore_timeout
+        if poll_frequency:
+            self.poll_frequency = poll_frequency
 
     def __enter__(self):
         """Abstract method called before an action"""
@@ -52,152 +61,210 @@ class BaseWaitAfter(object):
         """
         try:
             self._exit_action()
-        except Exception as e:
-            if isinstance(e, TimeoutException) and self.ignore_timeout:
-                self.logger.debug('Timeout when waiting...')
-                self.logger.debug(traceback.format_exc())
-            else:
-                raise e
+        except TimeoutException:
+            if not self.ignore_timeout:
+                raise
+            self.logger.debug('Timeout when waiting...', exc_info=True)
 
     @property
     def timeout(self):
         return self._timeout or self.context.timeout
 
     def _element(self, name):
-        """Looking for an element defined in the inheritence hierarchy by name"""
-        for base in inspect.getmro(self.context.__class__):
-            self.logger.debug('Looking for {} in {}'.format(name, base.__name__))
-            e = base.__dict__.get(name, None)
-            if e:
-                return e
-        return None
+        """Looking for an element defined in the inheritence hierarchy by name, collected when the class is created"""
+        self.logger.debug('Looking for %s in %s', name, self.context.__class__.__name__)
+        return self.context._page_elements.get(name)
 
 
 class WaitPageLoadedAfter(BaseWaitAfter):
     """
     Wait for page to be loaded after an action.
 
-    It compares the internal `id` property of WebElement representing <html> before and after the operation.
-    After the `id` is changed, it waits until `document.readyState` is complete.
+    It compares the WebElement representing <html> before and after the operation, and waits until the <html> is
+    replaced and `document.readyState` is complete. Both are checked by one script in each poll.
+    """
+
+    _html_script = 'return document.documentElement;'
+
+    # the <html> before the action is passed in, it is replaced when a new document is loaded. The new <html> is
+    # returned once the page is complete
+    _loaded_script = """
+        return arguments[0] !== document.documentElement && document.readyState == "complete" &&
+            document.documentElement;
     """
 
+    _ready_script = 'return document.readyState == "complete" && document.documentElement;'
+
     def __enter__(self):
-        """Read `id` of <html> before action"""
+        """Read <html> before action"""
         try:
-            self.old = self.context.find_element_by_tag_name('html').id
-        except NoSuchElementException:
+            self.old = self.context.execute_script(self._html_script)
+        except WebDriverException:
+            self.logger.debug('Cannot read <html> of the page.', exc_info=True)
             self.old = None
 
+    def _loaded(self, drv):
+        """Wait condition checking that <html> is replaced and the new page is complete"""
+        try:
+            return drv.execute_script(self._loaded_script, self.old)
+        except StaleElementReferenceException:
+            # the old <html> cannot be passed to the browser once its document is gone
+            return drv.execute_script(self._ready_script)
+
     def _exit_action(self, *args):
-        """Compoare `id` of <html> until it is change, then wait for `document.readyState` to be complete"""
-        self.context.wait(
-            lambda drv, old=self.old: old != self.context.find_element_by_tag_name('html').id, self.timeout)
-        new = self.context.find_element_by_tag_name('html').id
-        self.logger.debug('Page changed: old[{}] => new[{}]'.format(self.old, new))
-        self.context.wait(lambda drv: drv.execute_script('return document.readyState == "complete";'), self.timeout)
-        self.logger.debug('Page completed.')
+        """Wait until <html> is changed and `document.readyState` is complete"""
+        new = self.context.wait(self._loaded, self.timeout, poll_frequency=self.poll_frequency)
+        self.logger.debug('Page changed and completed: old[%s] => new[%s]', self.old.id if self.old else None, new.id)
 
 
 class WaitElementDisplayedAfter(BaseWaitAfter):
     """
     Wait an element to display after an operation. There is not enter action for this scenario.
     After action, it waits until the element exists in DOM and displayed.
+
+    The visibility is checked by `Element.checkVisibility()` of the browser, which costs less than `is_displayed()`.
+    The two checks do not always agree: both treat `display: none` and `visibility: hidden` as hidden, but
+    `checkVisibility()` also treats an element with `opacity: 0` as hidden and does not treat an element with a size
+    of zero or clipped by the overflow of an ancestor as hidden. Browsers without the method (older versions,
+    HtmlUnit) are checked by `is_displayed()`.
     """
-    def __init__(self, context, element_name, timeout=0, ignore_timeout=False):
-        """Initialize the wait object. save the name of the element"""
-        super(WaitElementDisplayedAfter, self).__init__(context, timeout, ignore_timeout)
+    # visibility of the element by the native check of the browser, null when the browser does not support it
+    _visible_script = """
+        var e = arguments[0];
+        return e.checkVisibility ? e.checkVisibility({checkOpacity: true, checkVisibilityCSS: true}) : null;
+    """
+
+    def __init__(self, context, element_name, timeout=0, ignore_timeout=False, poll_frequency=None):
+        """Initialize the wait object. save the name of the element and resolve its locator"""
+        super(WaitElementDisplayedAfter, self).__init__(context, timeout, ignore_timeout, poll_frequency)
         self.element_name = element_name
+        self.locator = self._element(element_name)._locator
+
+    def _visible(self, drv):
+        """
+        Locate the element in the context and check its visibility with one script.
+
+        Returns:
+            bool: True if the element is visible, False if it is hidden, None if it does not exist
+        """
+        try:
+            e = self.context.find_element(*self.locator)
+        except NoSuchElementException:
+            return None
+        visible = drv.execute_script(self._visible_script, e)
+        return e.is_displayed() if visible is None else visible
 
     def _exit_action(self, *args):
         """Wati until the element is in the DOM and visually displayed"""
-        e = self._element(self.element_name).locator
-        ctx = self.context
-        self.logger.debug('Waiting element to display: {} "{}"'.format(self.element_name, str(e)))
-        self.context.wait(
-            lambda drv: getattr(ctx, self.element_name, None) and
-            getattr(ctx, self.element_name).is_displayed(), self.timeout)
+        def _displayed(drv):
+            try:
+                return bool(self._visible(drv))
+            except StaleElementReferenceException:
+                self.logger.debug('Element is changing, check in next round...', exc_info=True)
+                return False
+
+        self.logger.debug('Waiting element to display: %s "%s"', self.element_name, self.locator[1])
+        self.context.wait(_displayed, self.timeout, poll_frequency=self.poll_frequency)
         self.logger.debug('Element displayed.')
 
 
-class WaitElementDisappearedAfter(BaseWaitAfter):
+class WaitElementDisappearedAfter(WaitElementDisplayedAfter):
     """
     Wait an element to disappear after an operation. There is not enter action for this scenario.
     After action, it waits until the element disappears from the DOM or visually hidden.
     """
-    def __init__(self, context, element_name, timeout=0, ignore_timeout=False):
-        """Initialize the wait object. save the name of the element"""
-        super(WaitElementDisappearedAfter, self).__init__(context, timeout, ignore_timeout)
-        self.element_name = element_name
 
     def _exit_action(self, *args):
         """Wait until the element is removed from DOM or visually hidden"""
-        def _disappeared(drv, ctx=self.context, name=self.element_name):
-            e = getattr(ctx, name)
+        def _disappeared(drv):
             try:
-                if not e:
-                    return True
-                elif not e.is_displayed():
-                    return True
-                else:
-                    return False
+                return not self._visible(drv)
             except StaleElementReferenceException:
-                self.logger.debug('Element is changing, check in next round...')
-                self.logger.debug(traceback.format_exc())
+                self.logger.debug('Element is changing, check in next round...', exc_info=True)
                 return False
 
-        e = self._element(self.element_name).locator
-        self.logger.debug('Waiting element to disappear: {} "{}"'.format(self.element_name, str(e)))
-        self.context.wait(_disappeared, self.timeout)
+        self.logger.debug('Waiting element to disappear: %s "%s"', self.element_name, self.locator[1])
+        self.context.wait(_disappeared, self.timeout, poll_frequency=self.poll_frequency)
         self.logger.debug('Element disappeared.')
 
 
 class WaitElementChangedAfter(BaseWaitAfter):
     """
     Wait an element to change after an operation. It uses the internal WebElement `id` to decide when an element
-    is changed.
+    is changed: the wait ends when an element matching the locator exists and differs from the one found before the
+    operation.
+    """
+    # find the element by a CSS selector in the context and return it if it is not the old one
+    _changed_script = """
+        var e = (arguments[1] || document).querySelector(arguments[2]);
+        return e !== null && e !== arguments[0] && e;
     """
-    def __init__(self, context, element_name, timeout=0, ignore_timeout=False):
-        """Initialize the wait object. save the context and name of the element"""
-        super(WaitElementChangedAfter, self).__init__(context, timeout, ignore_timeout)
-        e = self._element(element_name)
-        self.locator = e.by or By.ID, e.locator
+
+    def __init__(self, context, element_name, timeout=0, ignore_timeout=False, poll_frequency=None):
+        """Initialize the wait object. save the context and the locator of the element"""
+        super(WaitElementChangedAfter, self).__init__(context, timeout, ignore_timeout, poll_frequency)
+        self.locator = self._element(element_name)._locator
 
     def __enter__(self):
-        """Find the element and save its id"""
+        """Find the element and keep it"""
         try:
-            self.old = self.context.find_element(*self.locator).id
+            self.old = self.context.find_element(*self.locator)
         except NoSuchElementException:
-            self.logger.debug('Element does not exist.')
-            self.logger.debug(traceback.format_exc())
+            self.logger.debug('Element does not exist.', exc_info=True)
             self.old = None
+        self.gone = False
+
+    def _changed(self, drv):
+        """
+        Find the element and compare it with the old one. A CSS selector is checked with one script, other locators
+        or an old element which cannot be passed to the browser any more are checked by finding the element.
+
+        Returns:
+            WebElement: the new element, or False if it does not exist or is still the old one
+        """
+        if self.locator[0] == By.CSS_SELECTOR and not self.gone:
+            context = None if self.context is self.context.page else self.context.context
+            try:
+                return drv.execute_script(self._changed_script, self.old, context, self.locator[1])
+            except StaleElementReferenceException:
+                self.logger.debug('The old element is gone, finding the new one', exc_info=True)
+                self.gone = True
+        try:
+            new = self.context.find_element(*self.locator)
+        except NoSuchElementException:
+            return False
+        return new if self.old is None or self.gone or new.id != self.old.id else False
 
     def _exit_action(self, *args):
-        """Wait until id is changed"""
-        self.context.wait(lambda drv: self.old != self.context.find_element(*self.locator).id, self.timeout)
-        new = self.context.find_element(*self.locator).id
-        self.logger.debug('Element changed: old[{}] => new[{}]'.format(self.old, new))
+        """Wait until a new element replaces the old one"""
+        new = self.context.wait(self._changed, self.timeout, poll_frequency=self.poll_frequency)
+        self.logger.debug('Element changed: old[%s] => new[%s]', self.old.id if self.old else None, new.id)
 
 
 class WaitAJAXAfter(BaseWaitAfter):
     """
     Wait for an AJAX call to be finished. It uses different Javascript snippet to check asynch call status.
-    It support Jquery and ASP.net at the moment.
+    It support Jquery and ASP.net at the moment. Several libraries can be waited for together, their conditions are
+    checked by one script in each poll.
     """
-    _wait_ajax_after_script = {
-        'JQUERY': 'return jQuery.active == 0;',
-        'ASP.NET': 'return Sys.WebForms.PageRequestManager.getInstance().get_isInAsyncPostBack() == false;'
+    _ajax_conditions = {
+        'JQUERY': 'jQuery.active == 0',
+        'ASP.NET': 'Sys.WebForms.PageRequestManager.getInstance().get_isInAsyncPostBack() == false',
     }
 
-    def __init__(self, context, lib='JQUERY', timeout=0, ignore_timeout=False):
-        """Initialize the wait object."""
-        super(WaitAJAXAfter, self).__init__(context, timeout, ignore_timeout)
+    def __init__(self, context, lib='JQUERY', timeout=0, ignore_timeout=False, poll_frequency=None):
+        """Initialize the wait object. `lib` is the name of a library or a list of them"""
+        super(WaitAJAXAfter, self).__init__(context, timeout, ignore_timeout, poll_frequency)
         self.lib = lib
+        self.libs = (lib,) if isinstance(lib, str) else tuple(lib)
+        self.js = 'return {};'.format(' && '.join(
+            '({})'.format(self._ajax_conditions.get(name, 'true')) for name in self.libs) or 'true')
 
     def _exit_action(self, *args):
         """Wait until the status checking script returns True"""
-        self.logger.debug('Waiting for AJAX using {}'.format(self.lib))
-        js = self._wait_ajax_after_script.get(self.lib, 'return true;')
-        self.context.wait(lambda driver: driver.execute_script(js), self.timeout)
+        self.logger.debug('Waiting for AJAX using %s', self.lib)
+        self.context.wait(
+            lambda driver: driver.execute_script(self.js), self.timeout, poll_frequency=self.poll_frequency)
         self.logger.debug('AJAX done.')
 
 
@@ -206,37 +273,51 @@ class WaitHTTPRequestAfter(BaseWaitAfter):
     Wati for an HTTP request to be finished. It waits until the specified URL pattern is responded for a given
     number of time.
     """
-    def __init__(self, context, url_pattern, counter=1, timeout=0, ignore_timeout=False):
-        """Initialize the wait object."""
-        super(WaitHTTPRequestAfter, self).__init__(context, timeout, ignore_timeout)
-        self.clear_buffer = 'window.performance.clearResourceTimings();'
-        self.get_url_entries = 'return window.performance.getEntriesByType("resource");'
+    poll_frequency = SLOW_POLL
+
+    def __init__(self, context, url_pattern, counter=1, timeout=0, ignore_timeout=False, poll_frequency=None):
+        """Initialize the wait object. URLs are matched by the Python `re` pattern with `re.match()`."""
+        super(WaitHTTPRequestAfter, self).__init__(context, timeout, ignore_timeout, poll_frequency)
         self.url_pattern = re.compile(url_pattern)
         self.counter = counter
-        self.urls = {}
+        self.matched = 0
+
+    # clear the resource timing buffer and keep the entries of the buffer in a list when it becomes full, so that
+    # entries recorded after that are not dropped
+    _start_script = """
+        window.performance.clearResourceTimings();
+        window.__pageobjectResources = [];
+        window.performance.onresourcetimingbufferfull = function () {
+            window.performance.getEntriesByType("resource").forEach(function (e) {
+                window.__pageobjectResources.push(e.name);
+            });
+            window.performance.clearResourceTimings();
+        };
+    """
 
-    def _get_matching_url_entries(self):
-        """Read all entries of the matching URL access"""
-        entries = self.context.execute_script(self.get_url_entries)
-        return dict((e['startTime'], e['name']) for e in entries if self.url_pattern.match(e['name']))
+    # return URLs of the resources recorded since the last call, only new entries are sent on each poll
+    _new_urls_script = """
+        var urls = (window.__pageobjectResources || []).concat(
+            window.performance.getEntriesByType("resource").map(function (e) { return e.name; }));
+        window.__pageobjectResources = [];
+        window.performance.clearResourceTimings();
+        return urls;
+    """
 
     def _wait_urls(self, drv):
         """Wait until the specified URL is visited for a given number times"""
-        new_entries = self._get_matching_url_entries()
-        self.logger.debug('Matching URL access after operation: {}'.format(str(new_entries)))
-        for k in self.urls:
-            if k in new_entries:
-                new_entries.pop(k)
-        return len(new_entries) >= self.counter
+        urls = drv.execute_script(self._new_urls_script)
+        self.matched += sum(1 for url in urls if self.url_pattern.match(url))
+        self.logger.debug('Matching URL access after operation: %s', self.matched)
+        return self.matched >= self.counter
 
     def __enter__(self):
-        self.logger.debug('Waiting for {} request(s) to URL {}'.format(self.counter, self.url_pattern))
-        self.context.execute_script(self.clear_buffer)
-        self.urls = self._get_matching_url_entries()
-        self.logger.debug('Matching URL access before operation: {}'.format(str(self.urls)))
+        self.logger.debug('Waiting for %s request(s) to URL %s', self.counter, self.url_pattern.pattern)
+        self.matched = 0
+        self.context.execute_script(self._start_script)
 
     def _exit_action(self):
-        self.context.wait(self._wait_urls, self.timeout)
+        self.context.wait(self._wait_urls, self.timeout, poll_frequency=self.poll_frequency)
         self.logger.debug('URL access condition matched.')
 
 
@@ -255,7 +336,7 @@ class WaitMixin(object):
         """Try to use the timeout value of the component first, then the timeout value of the page"""
         return self._timeout or self.page._timeout
 
-    def wait(self, condition, timeout=0, ignore_timeout=False):
+    def wait(self, condition, timeout=0, ignore_timeout=False, poll_frequency=POLL_FREQUENCY, ignored_exceptions=None):
         """
         A general wait function wrapping WebDriverWait.until. It will intercept TimeoutException when
         ignore_timeout is set. Otherwise exceptions are thrown to caller.
@@ -265,21 +346,28 @@ class WaitMixin(object):
             timeout (int, optional): timeout value. Defaults to 0.
             ignore_timeout (bool, optional): If True, trap the TimeoutException, otherwise throw the exception to
             the caller. Defaults to False.
+            poll_frequency (float, optional): interval in seconds between two checks of the condition. Defaults to
+                the interval of WebDriverWait.
+            ignored_exceptions (iterable, optional): exceptions raised by the condition to be treated as not yet
+                satisfied. Defaults to None, only NoSuchElementException is ignored.
 
         Raises:
             e: any excetption raised by WebDriverWait.until
+
+        Returns:
+            The last return of the condition, or None if the timeout is ignored
         """
         self.logger.debug('Waiting for conditions...')
         try:
-            WebDriverWait(self.page, timeout or self.timeout).until(condition)
-        except TimeoutException as e:
-            if ignore_timeout:
-                self.logger.debug('Timeout when waiting...')
-                self.logger.debug(traceback.format_exc())
-            else:
-                raise e
-
-    def wait_page_loaded_after(self, timeout=0, ignore_timeout=False):
+            with self.page._explicit_wait():
+                wait = WebDriverWait(self.page, timeout or self.timeout, poll_frequency, ignored_exceptions)
+                return wait.until(condition)
+        except TimeoutException:
+            if not ignore_timeout:
+                raise
+            self.logger.debug('Timeout when waiting...', exc_info=True)
+
+    def wait_page_loaded_after(self, timeout=0, ignore_timeout=False, poll_frequency=None):
         """
         Wait page loaded after an action. It is supposed to be used in a `wait` block.
 
@@ -287,13 +375,15 @@ class WaitMixin(object):
             timeout (int, optional): timeout value. Defaults to 0.
             ignore_timeout (bool, optional): If True, trap the TimeoutException, otherwise throw the exception to
             the caller. Defaults to False.
+            poll_frequency (float, optional): interval in seconds between two checks. Defaults to None, the default
+                of the wait class.
 
         Returns:
             Wait object handling the wait context.
         """
-        return WaitPageLoadedAfter(self.page, timeout, ignore_timeout)
+        return WaitPageLoadedAfter(self.page, timeout, ignore_timeout, poll_frequency)
 
-    def wait_element_displayed_after(self, element_name, timeout=0, ignore_timeout=False):
+    def wait_element_displayed_after(self, element_name, timeout=0, ignore_timeout=False, poll_frequency=None):
         """
         Wait element to display after an action. It is supposed to be used in a `wait` block.
 
@@ -302,13 +392,15 @@ class WaitMixin(object):
             timeout (int, optional): timeout value. Defaults to 0.
             ignore_timeout (bool, optional): If True, trap the TimeoutException, otherwise throw the exception to
             the caller. Defaults to False.
+            poll_frequency (float, optional): interval in seconds between two checks. Defaults to None, the default
+                of the wait class.
 
         Returns:
             Wait object handling the wait context.
         """
-        return WaitElementDisplayedAfter(self, element_name, timeout, ignore_timeout)
+        return WaitElementDisplayedAfter(self, element_name, timeout, ignore_timeout, poll_frequency)
 
-    def wait_element_disappeared_after(self, element_name, timeout=0, ignore_timeout=False):
+    def wait_element_disappeared_after(self, element_name, timeout=0, ignore_timeout=False, poll_frequency=None):
         """
         Wait element to disappear after an action. It is supposed to be used in a `wait` block.
 
@@ -317,13 +409,15 @@ class WaitMixin(object):
             timeout (int, optional): timeout value. Defaults to 0.
             ignore_timeout (bool, optional): If True, trap the TimeoutException, otherwise throw the exception to
             the caller. Defaults to False.
+            poll_frequency (float, optional): interval in seconds between two checks. Defaults to None, the default
+                of the wait class.
 
         Returns:
             Wait object handling the wait context.
         """
-        return WaitElementDisappearedAfter(self, element_name, timeout, ignore_timeout)
+        return WaitElementDisappearedAfter(self, element_name, timeout, ignore_timeout, poll_frequency)
 
-    def wait_element_changed_after(self, element_name, timeout=0, ignore_timeout=False):
+    def wait_element_changed_after(self, element_name, timeout=0, ignore_timeout=False, poll_frequency=None):
         """
         Wait element to change after an action. It is supposed to be used in a `wait` block.
 
@@ -332,28 +426,33 @@ class WaitMixin(object):
             timeout (int, optional): timeout value. Defaults to 0.
             ignore_timeout (bool, optional): If True, trap the TimeoutException, otherwise throw the exception to
             the caller. Defaults to False.
+            poll_frequency (float, optional): interval in seconds between two checks. Defaults to None, the default
+                of the wait class.
 
         Returns:
             Wait object handling the wait context.
         """
-        return WaitElementChangedAfter(self, element_name, timeout, ignore_timeout)
+        return WaitElementChangedAfter(self, element_name, timeout, ignore_timeout, poll_frequency)
 
-    def wait_ajax_after(self, lib='JQUERY', timeout=0, ignore_timeout=False):
+    def wait_ajax_after(self, lib='JQUERY', timeout=0, ignore_timeout=False, poll_frequency=None):
         """
         Wait AJAX call to finish after an action. It is supposed to be used in a `wait` block.
 
         Args:
-            lib (str): the AJAX call initiator, can be 'JQUERY' or 'ASP.NET'. default to 'JQUERY'
+            lib (str or list): the AJAX call initiator, can be 'JQUERY' or 'ASP.NET', or a list of them to wait for
+                all of them. default to 'JQUERY'
             timeout (int, optional): timeout value. Defaults to 0.
             ignore_timeout (bool, optional): If True, trap the TimeoutException, otherwise throw the exception to
             the caller. Defaults to False.
+            poll_frequency (float, optional): interval in seconds between two checks. Defaults to None, the default
+                of the wait class.
 
         Returns:
             Wait object handling the wait context.
         """
-        return WaitAJAXAfter(self.page, lib, timeout, ignore_timeout)
+        return WaitAJAXAfter(self.page, lib, timeout, ignore_timeout, poll_frequency)
 
-    def wait_http_request_after(self, url_pattern, counter=1, timeout=0, ignore_timeout=False):
+    def wait_http_request_after(self, url_pattern, counter=1, timeout=0, ignore_timeout=False, poll_frequency=None):
         """
         Wait http request to be responded for a given number of times after an action. It is supposed to be used in
         a `wait` block.
@@ -364,8 +463,10 @@ class WaitMixin(object):
             timeout (int, optional): timeout value. Defaults to 0.
             ignore_timeout (bool, optional): If True, trap the TimeoutException, otherwise throw the exception to
             the caller. Defaults to False.
+            poll_frequency (float, optional): interval in seconds between two checks. Defaults to None, the default
+                of the wait class.
 
         Returns:
             Wait object handling the wait context.
         """
-        return WaitHTTPRequestAfter(self.page, url_pattern, counter, timeout, ignore_timeout)
+        return WaitHTTPRequestAfter(self.page, url_pattern, counter, timeout, ignore_timeout, poll_frequency)
@@ -0,0 +1,37 @@
+import os
+
+
+def make_driver(kind=None):
+    """
+    Create the WebDriver used by the demo tests.
+
+    Args:
+        kind (str, optional): 'chrome-headless', 'chrome', 'firefox-headless', 'firefox' or 'htmlunit'. Defaults to
+            None, which reads the environment variable `WEBDRIVER` and falls back to 'chrome-headless'. HtmlUnit runs
+            on the Selenium server at `WEBDRIVER_URL` (http://localhost:4444/wd/hub by default).
+
+    Returns:
+        WebDriver: the created driver
+    """
+    # imported here so that importing the page classes of the demo does not load the driver packages
+    from selenium import webdriver
+    from selenium.webdriver.common.options import ArgOptions
+
+    kind = kind or os.getenv('WEBDRIVER', 'chrome-headless')
+    if kind.startswith('chrome'):
+        options = webdriver.ChromeOptions()
+        if kind == 'chrome-headless':
+            options.add_argument('--headless=new')
+            # the demo only reads the pages, skip downloading and rendering images
+            options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        return webdriver.Chrome(options=options)
+    if kind.startswith('firefox'):
+        options = webdriver.FirefoxOptions()
+        if kind == 'firefox-headless':
+            options.add_argument('-headless')
+        return webdriver.Firefox(options=options)
+    if kind == 'htmlunit':
+        options = ArgOptions()
+        options.set_capability('browserName', 'htmlunit')
+        return webdriver.Remote(os.getenv('WEBDRIVER_URL', 'http://localhost:4444/wd/hub'), options=options)
+    raise ValueError('Unknown WebDriver: {}'.format(kind))
@@ -1,9 +1,9 @@
 from pageobject import PageObject, PageElement, PageComponent, PageTable
 from pageobject.decorators import nextpage, pageconfig, tableconfig
 from pageobject.wait import WaitAJAXAfter
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from unittest import TestCase
+from ._driver import make_driver
 
 
 @pageconfig(default_by=By.CSS_SELECTOR)
@@ -14,8 +14,7 @@ class TestLoginPage(PageObject):
 
     @nextpage('test.test.BasePage')
     def login(self, user, password):
-        self.user = user
-        self.password = password
+        self.fill(user=user, password=password)
         with self.wait_page_loaded_after(timeout=10):
             self.login_button.click()
 
@@ -27,10 +26,13 @@ class PageNavigator(PageComponent):
     @nextpage({
         'bookings': 'test.test.BookingsPage',
     })
-    def nav(self, menu):
-        with WaitAJAXAfter(self.page):
-            getattr(self, menu).click()
-        return menu
+    def nav(self, *menus):
+        # click through nested menus and wait for AJAX calls of all clicks once. Sub-menus may show up a moment
+        # after their parents are clicked, let the browser wait for them
+        with WaitAJAXAfter(self.page), self.page.implicit(5):
+            for menu in menus:
+                getattr(self, menu).click()
+        return menus[-1]
 
 
 @pageconfig(default_by=By.TAG_NAME)
@@ -57,11 +59,12 @@ class BookingRow(PageComponent):
 
     @nextpage('test.test.BasePage')
     def view(self):
-        windows_count = len(self.page.window_handles)
+        handles = set(self.page.window_handles)
         with WaitAJAXAfter(self.page):
             self.view_button.click()
-        self.page.wait(lambda drv: len(drv.window_handles) > windows_count)
-        self.page.window(-1)
+        # the condition returns the handles of new windows, switch to the one opened without listing them again
+        opened = self.page.wait(lambda drv: set(drv.window_handles) - handles)
+        self.page.window(opened.pop())
 
     @nextpage('test.test.BasePage')
     def edit(self):
@@ -91,16 +94,30 @@ class BookingsPage(BasePage):
 
 class DemoTest(TestCase):
 
+    # one browser is shared by all tests of the class, starting it is the slowest part of a test
+    @classmethod
+    def setUpClass(cls):
+        cls.drv = make_driver()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.drv.quit()
+
     def setUp(self):
         self.baseurl = 'https://www.phptravels.net/admin'
         self.user = 'admin@phptravels.com'
         self.pwd = 'demoadmin'
-        drv = webdriver.Firefox()
-        drv.get(self.baseurl)
-        self.page = TestLoginPage(drv)
+        # every test starts logged out on the login page
+        self.drv.delete_all_cookies()
+        self.drv.get(self.baseurl)
+        self.page = TestLoginPage(self.drv)
 
     def tearDown(self):
-        self.page.quit()
+        # close windows opened by the test and leave the first one to the next test
+        for handle in self.drv.window_handles[1:]:
+            self.drv.switch_to.window(handle)
+            self.drv.close()
+        self.drv.switch_to.window(self.drv.window_handles[0])
 
     def _login(self, usr=None, pwd=None):
         self.page = self.page.login(usr or self.user, pwd or self.pwd)
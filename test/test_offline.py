@@ -0,0 +1,492 @@
+"""
+Tests running without a browser. The driver and the elements are mocks answering the lookups and the scripts of the
+package from a small tree of elements, so that the paths saving requests to the browser can be checked against the
+paths reading elements one by one.
+"""
+import itertools
+import logging
+from unittest import TestCase
+from unittest.mock import MagicMock, PropertyMock, patch
+from selenium.common.exceptions import JavascriptException, NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from pageobject import PageObject, PageElement, PageElementDict, PageComponent, PageTable
+from pageobject.pageobject import _normalize_locator, _condition, _build_condition, _cached_condition
+from pageobject.decorators import tableconfig
+from pageobject.wait import WaitPageLoadedAfter, WaitElementDisplayedAfter, WaitElementChangedAfter, \
+    WaitHTTPRequestAfter, FAST_POLL, SLOW_POLL
+
+_ids = itertools.count()
+
+
+def make_driver(**children):
+    """Create a driver mock. `children` are the elements found in the document by CSS selector"""
+    drv = MagicMock()
+    drv.children = children
+    # scripts answered by the test, by the script source. Other scripts of the package are answered by `_run_script`
+    drv.scripts = {}
+    drv.find_elements.side_effect = lambda by, loc: list(drv.children.get(loc, []))
+    drv.find_element.side_effect = lambda by, loc: _first(drv.children.get(loc), loc)
+    drv.execute_script.side_effect = lambda script, *args: _run_script(drv, script, *args)
+    return drv
+
+
+def make_element(drv, tag='div', text='', input_type=None, **children):
+    """Create an element mock in the driver. `children` are the elements found in it by CSS selector"""
+    e = MagicMock(spec=WebElement)
+    e.id = 'e{}'.format(next(_ids))
+    e.parent = drv
+    e.tag_name = tag
+    e.text = text
+    e.children = children
+    e.is_displayed.return_value = True
+    e.get_attribute.side_effect = {'textContent': text, 'value': text, 'type': input_type}.get
+    e.find_elements.side_effect = lambda by, loc: list(e.children.get(loc, []))
+    e.find_element.side_effect = lambda by, loc: _first(e.children.get(loc), loc)
+    return e
+
+
+def _first(elements, loc):
+    if not elements:
+        raise NoSuchElementException(loc)
+    return elements[0]
+
+
+def _field(row, selector):
+    cells = row.children.get(selector)
+    return cells[0].get_attribute('textContent').strip() if cells else None
+
+
+def _run_script(drv, script, *args):
+    if script in drv.scripts:
+        return drv.scripts[script](*args)
+    if script == PageElement._tag_and_type_script:
+        return [args[0].tag_name, args[0].get_attribute('type'), False]
+    if script == PageTable._row_batch_script:
+        return args[0].children.get(args[1], [])[args[2]:args[3]]
+    if script == PageTable._scrape_rows_script:
+        return [[_field(row, selector) for selector, _ in args[1]] for row in args[0]]
+    if script == PageTable._cell_texts_script:
+        return [[c.text for c in row.children.get('td, th', [])] for row in args[0]]
+    return None
+
+
+def _scripts(drv, script):
+    """Calls of the driver running the script"""
+    return [c for c in drv.execute_script.call_args_list if c[0][0] == script]
+
+
+class LocatorTest(TestCase):
+
+    def test_normalize_locator(self):
+        cases = [
+            ((By.ID, 'user'), (By.CSS_SELECTOR, '[id="user"]')),
+            ((By.NAME, 'email'), (By.CSS_SELECTOR, '[name="email"]')),
+            ((By.CLASS_NAME, 'total'), (By.CSS_SELECTOR, '.total')),
+            ((By.TAG_NAME, 'td'), (By.CSS_SELECTOR, 'td')),
+            # kept as they are
+            ((By.CLASS_NAME, 'btn primary'), (By.CLASS_NAME, 'btn primary')),
+            ((By.LINK_TEXT, 'Next'), (By.LINK_TEXT, 'Next')),
+        ]
+        for locator, expected in cases:
+            with self.subTest(locator=locator):
+                self.assertEqual(_normalize_locator(*locator), expected)
+
+    def test_normalize_simple_xpath(self):
+        cases = [
+            ('.//td', (By.CSS_SELECTOR, 'td')),
+            ('.//td[@class="total"]', (By.CSS_SELECTOR, 'td[class="total"]')),
+            ('.//*[@id=\'user\']', (By.CSS_SELECTOR, '[id="user"]')),
+            # kept as they are
+            ('//td', (By.XPATH, '//td')),
+            ('.//td[@title="total"]', (By.XPATH, './/td[@title="total"]')),
+        ]
+        for loc, expected in cases:
+            with self.subTest(loc=loc):
+                self.assertEqual(_normalize_locator(By.XPATH, loc), expected)
+
+    def test_combine_items_loc(self):
+        cases = [
+            (('#menu', 'li', By.CSS_SELECTOR, None), (By.CSS_SELECTOR, '#menu li')),
+            (('menu', 'li', None, By.CSS_SELECTOR), (By.CSS_SELECTOR, '[id="menu"] li')),
+            (('//ul', './li', By.XPATH, None), (By.XPATH, '(//ul)[1]/li')),
+            # the container may match more than one element
+            (('.menu', 'li', By.CSS_SELECTOR, None), None),
+            (('#menu', 'li, dt', By.CSS_SELECTOR, None), None),
+            (('//ul', '//li', By.XPATH, None), None),
+            (('#menu', './li', By.CSS_SELECTOR, By.XPATH), None),
+        ]
+        for (loc, item_loc, by, item_by), expected in cases:
+            with self.subTest(loc=loc, item_loc=item_loc):
+                d = PageElementDict(loc, item_loc, 'b', 'span', by=by, item_by=item_by)
+                self.assertEqual(d.items_loc, expected)
+
+    def test_combined_items_found_in_one_lookup(self):
+        class MenuPage(PageObject):
+            menu = PageElementDict('#menu', 'li', 'b', 'span', by=By.CSS_SELECTOR)
+
+        drv = make_driver()
+        items = [make_element(drv, 'li'), make_element(drv, 'li')]
+        container = make_element(drv, 'ul', li=items)
+        drv.children.update({'#menu': [container], '#menu li': items})
+        page = MenuPage(drv)
+
+        self.assertEqual(MenuPage.menu._get_items(page), container.find_elements(By.CSS_SELECTOR, 'li'))
+        drv.find_elements.assert_called_once_with(By.CSS_SELECTOR, '#menu li')
+        drv.find_element.assert_not_called()
+
+
+class ConditionTest(TestCase):
+
+    def setUp(self):
+        self.logger = logging.getLogger('pageobject')
+
+    def test_cached_by_value_and_type(self):
+        self.assertIs(_condition('a', self.logger, False), _condition('a', self.logger, False))
+        self.assertIsNot(_condition(1, self.logger, False), _condition(True, self.logger, False))
+
+    def test_callables_and_unhashable_values_not_cached(self):
+        size = _cached_condition.cache_info().currsize
+        self.assertTrue(_condition(lambda x: x > 1, self.logger, False)(2))
+        self.assertTrue(_condition(['a'], self.logger, False)(['a']))
+        self.assertEqual(_cached_condition.cache_info().currsize, size)
+
+    def test_same_result_as_built_condition(self):
+        e = make_element(make_driver(), text=' a ')
+        for ref, value in [('a', 'a'), ('a', 'b'), ('a', e), ('b', e), (None, None), (1, 1), (lambda x: x, 0)]:
+            with self.subTest(ref=ref, value=value):
+                self.assertEqual(
+                    _condition(ref, self.logger, True)(value), _build_condition(ref, self.logger, True)(value))
+
+
+class CachePage(PageObject):
+    box = PageElement('#box', by=By.CSS_SELECTOR, cache=True)
+    plain = PageElement('#box', by=By.CSS_SELECTOR)
+
+
+class ElementCacheTest(TestCase):
+
+    def setUp(self):
+        self.drv = make_driver()
+        self.box = make_element(self.drv)
+        self.drv.children['#box'] = [self.box]
+        self.page = CachePage(self.drv)
+
+    def test_cached_element_reused(self):
+        self.assertIs(self.page.box, self.box)
+        self.assertIs(self.page.box, self.box)
+        self.assertEqual(self.drv.find_elements.call_count, 1)
+        # elements without cache are located on every access
+        self.assertIs(self.page.plain, self.page.plain)
+        self.assertEqual(self.drv.find_elements.call_count, 3)
+
+    def test_invalidate_cache(self):
+        self.page.box
+        self.page.invalidate_cache()
+        self.page.box
+        self.assertEqual(self.drv.find_elements.call_count, 2)
+
+    def test_stale_element_located_again(self):
+        self.page.box
+        type(self.box).tag_name = PropertyMock(side_effect=StaleElementReferenceException('stale'))
+        new = make_element(self.drv)
+        self.drv.children['#box'] = [new]
+        self.assertIs(self.page.box, new)
+        self.assertIs(self.page.box, new)
+        self.assertEqual(self.drv.find_elements.call_count, 2)
+
+    def test_access_hooks_called_for_cached_elements(self):
+        hook = self.page.on_access_element = MagicMock()
+        self.page.plain
+        uncached = hook.call_count
+        hook.reset_mock()
+        self.page.box
+        self.page.box
+        self.assertEqual(hook.call_count, 2 * uncached)
+
+
+class Row(PageComponent):
+    name = PageElement('.name', by=By.CSS_SELECTOR, value_only=True)
+    age = PageElement('.age', by=By.CSS_SELECTOR, value_only=True)
+
+
+@tableconfig(row_locator=(By.CSS_SELECTOR, 'tr'), row_component=Row)
+class Table(PageTable):
+    _stream_batch_size = 2
+
+
+class HookedRow(Row):
+    on_access_element = MagicMock()
+
+
+@tableconfig(row_locator=(By.CSS_SELECTOR, 'tr'), row_component=HookedRow)
+class HookedTable(PageTable):
+    pass
+
+
+@tableconfig(row_locator=(By.CSS_SELECTOR, 'tr'))
+class PlainTable(PageTable):
+    pass
+
+
+class TablePage(PageObject):
+    table = PageElement('table', by=By.CSS_SELECTOR, component=Table)
+    plain_table = PageElement('table', by=By.CSS_SELECTOR, component=PlainTable)
+    hooked_table = PageElement('table', by=By.CSS_SELECTOR, component=HookedTable)
+
+
+class TableTest(TestCase):
+
+    def setUp(self):
+        self.drv = drv = make_driver()
+        self.rows = []
+        for i in range(5):
+            name, age = make_element(drv, 'span', 'n{}'.format(i)), make_element(drv, 'span', str(20 + i))
+            self.rows.append(make_element(drv, 'tr', 'r{}'.format(i), **{
+                '.name': [name], '.age': [age], 'td, th': [name, age]}))
+        self.table_element = make_element(drv, 'table', tr=self.rows)
+        drv.children['table'] = [self.table_element]
+        self.page = TablePage(drv)
+        self.table = self.page.table
+
+    def _read_rows(self, *columns):
+        """Read the rows one by one through the row component"""
+        return [{c: getattr(Row(row, self.page), c) for c in columns} for row in self.rows]
+
+    def test_slice_located_with_one_request(self):
+        self.assertEqual([row.context for row in self.table[1:3]], self.rows[1:3])
+        self.assertIs(self.table[-1].context, self.rows[-1])
+        self.assertEqual(self.table_element.find_elements.call_count, 2)
+
+    def test_iter_query_fetches_batches(self):
+        self.assertIs(next(self.table.iter_query(text=lambda t: t == 'r1')).context, self.rows[1])
+        self.assertEqual(len(_scripts(self.drv, PageTable._row_batch_script)), 1)
+        self.assertEqual(
+            [row.context for row in self.table.iter_query(text=lambda t: t in ('r1', 'r4'))],
+            [row.context for row in self.table.query(text=lambda t: t in ('r1', 'r4'))])
+
+    def test_query_plain_values_in_browser(self):
+        expected = [row for row, values in zip(self.rows, self._read_rows('name')) if values['name'] == 'n2']
+        self.drv.execute_script.reset_mock()
+        self.assertEqual([row.context for row in self.table.query(name='n2')], expected)
+        self.assertEqual(len(_scripts(self.drv, PageTable._scrape_rows_script)), 1)
+        self.assertEqual(len(_scripts(self.drv, PageElement._tag_and_type_script)), 0)
+
+    def test_query_calls_page_hook(self):
+        hook = self.page.on_access_element = MagicMock()
+        self.table.query(name='n2')
+        hook.assert_called_once_with()
+
+    def test_query_reads_rows_with_access_hook(self):
+        HookedRow.on_access_element.reset_mock()
+        self.assertEqual([row.context for row in self.page.hooked_table.query(name='n2')], [self.rows[2]])
+        self.assertEqual(len(_scripts(self.drv, PageTable._scrape_rows_script)), 0)
+        self.assertEqual(HookedRow.on_access_element.call_count, 5)
+
+    def test_query_once_stops_in_browser(self):
+        self.drv.scripts[PageTable._first_row_script] = lambda table, loc, fields, expected: self.rows[3]
+        self.assertIs(self.table.query(once=True, name='n3').context, self.rows[3])
+        (_, table, loc, fields, expected), = [c[0] for c in _scripts(self.drv, PageTable._first_row_script)]
+        self.assertEqual((table, loc, fields, expected), (self.table_element, 'tr', [('.name', True)], ['n3']))
+
+    def test_query_once_calls_page_hook(self):
+        hook = self.page.on_access_element = MagicMock()
+        self.drv.scripts[PageTable._first_row_script] = lambda table, loc, fields, expected: self.rows[3]
+        self.table.query(once=True, name='n3')
+        hook.assert_called_once_with()
+
+    def test_snapshot_same_as_reading_rows(self):
+        expected = self._read_rows('name', 'age')
+        self.drv.execute_script.reset_mock()
+        self.assertEqual(self.table.snapshot(), expected)
+        self.assertEqual(self.table.snapshot('age'), [{'age': r['age']} for r in expected])
+        self.assertEqual(len(self.drv.execute_script.call_args_list), 2)
+
+    def test_snapshot_without_row_attributes(self):
+        table = self.page.plain_table
+        self.assertEqual(table.snapshot(), [['n{}'.format(i), str(20 + i)] for i in range(5)])
+        self.assertRaises(ValueError, table.snapshot, 'name')
+
+    def test_snapshot_calls_page_hook(self):
+        plain_table = self.page.plain_table
+        hook = self.page.on_access_element = MagicMock()
+        self.table.snapshot()
+        plain_table.snapshot()
+        self.assertEqual(hook.call_count, 2)
+
+    def test_snapshot_reads_rows_with_access_hook(self):
+        HookedRow.on_access_element.reset_mock()
+        self.assertEqual(self.page.hooked_table.snapshot(), self._read_rows('name', 'age'))
+        self.assertEqual(len(_scripts(self.drv, PageTable._scrape_rows_script)), 0)
+        self.assertEqual(HookedRow.on_access_element.call_count, 2 * 5)
+
+
+class LoginPage(PageObject):
+    user = PageElement('#user', by=By.CSS_SELECTOR)
+    password = PageElement('#password', by=By.CSS_SELECTOR)
+    login = PageElement('#login', by=By.CSS_SELECTOR)
+    help = PageElement('//a[text()="Help"]', by=By.XPATH)
+    help_text = PageElement('//a[text()="Help"]', by=By.XPATH, value_only=True)
+    help_hooked = PageElement('//a[text()="Help"]', by=By.XPATH, read_hook=lambda page, e: e.text)
+
+
+class FillClickTest(TestCase):
+
+    def setUp(self):
+        self.drv = make_driver()
+        self.user = make_element(self.drv, 'input', input_type='text')
+        self.password = make_element(self.drv, 'input', input_type='password')
+        self.help = make_element(self.drv, 'a')
+        self.drv.children.update(
+            {'#user': [self.user], '#password': [self.password], '//a[text()="Help"]': [self.help]})
+        self.page = LoginPage(self.drv)
+        self.page.clear_text = MagicMock()
+
+    def test_fill_with_one_script(self):
+        self.drv.scripts[PageObject._fill_script] = lambda context, selectors, values: True
+        self.page.fill(user='admin', password=1234)
+        self.assertEqual(_scripts(self.drv, PageObject._fill_script)[0][0][1:],
+                         (None, ['#user', '#password'], ['admin', '1234']))
+        self.drv.find_element.assert_not_called()
+        self.user.send_keys.assert_not_called()
+
+    def test_fill_falls_back_to_assignment(self):
+        self.drv.scripts[PageObject._fill_script] = lambda context, selectors, values: False
+        self.page.fill(user='admin', password=1234)
+        self.user.send_keys.assert_called_once_with('admin')
+        self.password.send_keys.assert_called_once_with('1234')
+
+    def test_fill_without_values(self):
+        self.page.fill()
+        self.drv.execute_script.assert_not_called()
+
+    def test_fill_unknown_field(self):
+        self.assertRaises(AttributeError, self.page.fill, user='admin', usr='admin')
+        self.assertNotIn('usr', vars(self.page))
+        self.drv.execute_script.assert_not_called()
+        self.user.send_keys.assert_not_called()
+
+    def test_click_fast(self):
+        self.drv.scripts[PageObject._click_script] = lambda context, selector: selector in self.drv.children
+        self.page.click_fast('user')
+        self.assertEqual(_scripts(self.drv, PageObject._click_script)[0][0][1:], (None, '#user'))
+        self.user.click.assert_not_called()
+        self.assertRaises(NoSuchElementException, self.page.click_fast, 'login')
+        # elements not located by CSS selectors are clicked natively
+        self.page.click_fast('help')
+        self.help.click.assert_called_once_with()
+
+    def test_click_fast_raw_element_of_value_descriptors(self):
+        self.page.click_fast('help_text')
+        self.page.click_fast('help_hooked')
+        self.assertEqual(self.help.click.call_count, 2)
+        self.assertRaises(AttributeError, self.page.click_fast, 'hlep')
+
+
+class WaitPage(PageObject):
+    box = PageElement('#box', by=By.CSS_SELECTOR)
+    row = PageElement('//tr', by=By.XPATH)
+
+
+class WaitTest(TestCase):
+
+    def setUp(self):
+        self.drv = make_driver()
+        self.box = make_element(self.drv)
+        self.drv.children['#box'] = [self.box]
+        self.page = WaitPage(self.drv)
+
+    def test_poll_frequency(self):
+        with patch('pageobject.wait.WebDriverWait') as wait:
+            with self.page.wait_ajax_after(timeout=3):
+                pass
+            with self.page.wait_http_request_after('/api', timeout=3):
+                pass
+            with self.page.wait_element_displayed_after('box', timeout=3, poll_frequency=0.5):
+                pass
+        self.assertEqual([c[0][1:] for c in wait.call_args_list],
+                         [(3, FAST_POLL, None), (3, SLOW_POLL, None), (3, 0.5, None)])
+
+    def test_page_loaded(self):
+        old, new = make_element(self.drv, 'html'), make_element(self.drv, 'html')
+        loaded = iter([False, new])
+        self.drv.scripts[WaitPageLoadedAfter._html_script] = lambda: old
+        self.drv.scripts[WaitPageLoadedAfter._loaded_script] = lambda html: next(loaded)
+        with self.page.wait_page_loaded_after(timeout=1):
+            pass
+        self.assertEqual([c[0][1] for c in _scripts(self.drv, WaitPageLoadedAfter._loaded_script)], [old, old])
+
+    def test_page_loaded_after_old_page_gone(self):
+        def stale(html):
+            raise StaleElementReferenceException('stale')
+
+        self.drv.scripts[WaitPageLoadedAfter._html_script] = lambda: make_element(self.drv, 'html')
+        self.drv.scripts[WaitPageLoadedAfter._loaded_script] = stale
+        self.drv.scripts[WaitPageLoadedAfter._ready_script] = lambda: make_element(self.drv, 'html')
+        with self.page.wait_page_loaded_after(timeout=1):
+            pass
+        self.assertEqual(len(_scripts(self.drv, WaitPageLoadedAfter._ready_script)), 1)
+
+    def test_element_displayed(self):
+        self.drv.scripts[WaitElementDisplayedAfter._visible_script] = lambda e: True
+        with self.page.wait_element_displayed_after('box', timeout=1):
+            pass
+        self.box.is_displayed.assert_not_called()
+
+    def test_element_displayed_without_check_visibility(self):
+        self.drv.scripts[WaitElementDisplayedAfter._visible_script] = lambda e: None
+        with self.page.wait_element_displayed_after('box', timeout=1):
+            pass
+        self.box.is_displayed.assert_called_once_with()
+
+    def test_element_disappeared(self):
+        with self.page.wait_element_disappeared_after('box', timeout=1):
+            self.drv.children['#box'] = []
+        self.assertEqual(len(_scripts(self.drv, WaitElementDisplayedAfter._visible_script)), 0)
+
+    def test_element_changed(self):
+        new = make_element(self.drv)
+        changed = iter([False, new])
+        self.drv.scripts[WaitElementChangedAfter._changed_script] = lambda old, context, selector: next(changed)
+        with self.page.wait_element_changed_after('box', timeout=1):
+            pass
+        self.assertEqual([c[0][1:] for c in _scripts(self.drv, WaitElementChangedAfter._changed_script)],
+                         [(self.box, None, '#box')] * 2)
+
+    def test_element_changed_by_xpath(self):
+        old, new = make_element(self.drv, 'tr'), make_element(self.drv, 'tr')
+        self.drv.children['//tr'] = [old]
+        with self.page.wait_element_changed_after('row', timeout=1):
+            self.drv.children['//tr'] = [new]
+        self.assertEqual(len(_scripts(self.drv, WaitElementChangedAfter._changed_script)), 0)
+
+    def test_ajax_checked_by_one_script(self):
+        self.drv.execute_script.side_effect = lambda script: True
+        with self.page.wait_ajax_after(['JQUERY', 'ASP.NET'], timeout=1):
+            pass
+        (script,), = [c[0] for c in self.drv.execute_script.call_args_list]
+        self.assertIn('jQuery.active == 0', script)
+        self.assertIn('get_isInAsyncPostBack() == false', script)
+
+    def test_ajax_error_reported(self):
+        def missing():
+            raise JavascriptException('jQuery is not defined')
+
+        self.drv.execute_script.side_effect = lambda script: missing()
+        with self.assertRaises(JavascriptException):
+            with self.page.wait_ajax_after(timeout=1):
+                pass
+
+    def test_http_request(self):
+        urls = iter([['http://host/api/1', 'http://host/logo.png'], [], ['http://host/api/2']])
+        self.drv.scripts[WaitHTTPRequestAfter._new_urls_script] = lambda: next(urls)
+        with self.page.wait_http_request_after(r'.*/api/', 2, timeout=2):
+            pass
+        self.assertEqual(len(_scripts(self.drv, WaitHTTPRequestAfter._start_script)), 1)
+        self.assertEqual(len(_scripts(self.drv, WaitHTTPRequestAfter._new_urls_script)), 3)
+
+    def test_implicit_wait_restored(self):
+        self.drv.timeouts.implicit_wait = 2
+        with self.page.implicit(5):
+            self.page.wait(lambda drv: True, 1)
+        self.assertEqual([c[0][0] for c in self.drv.implicitly_wait.call_args_list], [5, 0, 5, 2])